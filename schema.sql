@@ -102,6 +102,7 @@ CREATE TABLE IF NOT EXISTS agent_sessions (
     session_id TEXT NOT NULL UNIQUE,
     transcript_path TEXT,
     workspace_path TEXT,
+    workspace_name TEXT GENERATED ALWAYS AS (lower(regexp_replace(rtrim(workspace_path, '/'), '^.*/', ''))) STORED,
     provider TEXT DEFAULT 'claude',
     session_title TEXT,
     session_summary TEXT,
@@ -114,6 +115,10 @@ CREATE TABLE IF NOT EXISTS agent_sessions (
     updated_at TIMESTAMPTZ DEFAULT NOW()
 );
 
+-- Added after the initial release; brings existing databases up to date
+ALTER TABLE agent_sessions ADD COLUMN IF NOT EXISTS
+    workspace_name TEXT GENERATED ALWAYS AS (lower(regexp_replace(rtrim(workspace_path, '/'), '^.*/', ''))) STORED;
+
 -- Individual conversation turns
 CREATE TABLE IF NOT EXISTS agent_turns (
     id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
@@ -225,12 +230,39 @@ CREATE INDEX IF NOT EXISTS idx_sprints_dates ON sprints(starts_at, ends_at);
 
 -- Context system indexes
 CREATE INDEX IF NOT EXISTS idx_agent_sessions_workspace ON agent_sessions(workspace_path);
+CREATE INDEX IF NOT EXISTS idx_agent_sessions_workspace_name ON agent_sessions(workspace_name);
+-- Legacy `record --all` rows hold Claude's mangled project dir; see _workspace_filter
+CREATE INDEX IF NOT EXISTS idx_agent_sessions_workspace_mangled ON agent_sessions(reverse(lower(workspace_path)) text_pattern_ops)
+    WHERE workspace_path NOT LIKE '%/%';
 CREATE INDEX IF NOT EXISTS idx_agent_sessions_project ON agent_sessions(project_id);
 CREATE INDEX IF NOT EXISTS idx_agent_sessions_processed ON agent_sessions(is_processed) WHERE is_processed = FALSE;
 CREATE INDEX IF NOT EXISTS idx_agent_sessions_activity ON agent_sessions(last_activity_at);
 CREATE INDEX IF NOT EXISTS idx_agent_turns_session ON agent_turns(session_id);
 CREATE INDEX IF NOT EXISTS idx_agent_turns_hash ON agent_turns(content_hash);
+-- Databases recorded before this index existed can hold the same turn twice
+-- in a session; keep the first copy (dependent rows cascade) and recount
+-- the affected sessions, otherwise the unique index below fails to build
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_indexes WHERE indexname = 'idx_agent_turns_session_hash') THEN
+        WITH removed AS (
+            DELETE FROM agent_turns t
+            USING agent_turns keep
+            WHERE keep.session_id = t.session_id
+              AND keep.content_hash = t.content_hash
+              AND keep.turn_number < t.turn_number
+            RETURNING t.session_id
+        )
+        -- The count still sees the pre-DELETE snapshot, hence the subtraction
+        UPDATE agent_sessions s
+        SET turn_count = (SELECT count(*) FROM agent_turns WHERE session_id = s.id) - r.n
+        FROM (SELECT session_id, count(*) AS n FROM removed GROUP BY session_id) r
+        WHERE s.id = r.session_id;
+    END IF;
+END $$;
+CREATE UNIQUE INDEX IF NOT EXISTS idx_agent_turns_session_hash ON agent_turns(session_id, content_hash);
 CREATE INDEX IF NOT EXISTS idx_agent_turns_started ON agent_turns(started_at);
+CREATE INDEX IF NOT EXISTS idx_agent_turn_content_files ON agent_turn_content USING GIN (files_touched);
 CREATE INDEX IF NOT EXISTS idx_agent_turn_entities_turn ON agent_turn_entities(turn_id);
 CREATE INDEX IF NOT EXISTS idx_agent_turn_entities_entity ON agent_turn_entities(entity_type, entity_id);
 CREATE INDEX IF NOT EXISTS idx_agent_turn_artifacts_turn ON agent_turn_artifacts(turn_id);
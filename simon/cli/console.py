@@ -0,0 +1,15 @@
+"""Lazily constructed rich console shared by CLI commands."""
+
+import functools
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+@functools.cache
+def get_console() -> "Console":
+    """Return the process-wide rich Console, importing rich on first use."""
+    from rich.console import Console
+
+    return Console()
@@ -29,7 +29,7 @@ def context_query(
         from simon.context.classifier import PromptClassifier
         from simon.context.formatter import format_context_blocks
         from simon.context.retriever import ContextRetriever
-        from simon.storage.db import get_session
+        from simon.storage.db import get_session, get_session_factory
 
         async with get_session() as session:
             classifier = PromptClassifier()
@@ -45,7 +45,7 @@ def context_query(
             console.print(f"  Confidence: {classification.confidence:.1%}")
 
             retriever = ContextRetriever()
-            blocks = await retriever.retrieve(session, classification, max_tokens=max_tokens)
+            blocks = await retriever.retrieve(get_session_factory(), classification, max_tokens=max_tokens)
 
             formatted = format_context_blocks(blocks, max_tokens=max_tokens)
             if formatted:
@@ -99,52 +99,55 @@ def context_stats(
         logging.basicConfig(level=logging.DEBUG)
 
     async def _run():
-        from sqlalchemy import func, select
+        from sqlalchemy import text
 
         from simon.storage.db import get_session
         from simon.storage.jobs import get_job_stats
-        from simon.storage.models import AgentSession, AgentTurn, AgentTurnEntity
 
         async with get_session() as session:
-            # Session counts
-            total_sessions = (await session.execute(
-                select(func.count()).select_from(AgentSession)
-            )).scalar()
-
-            processed_sessions = (await session.execute(
-                select(func.count()).select_from(AgentSession)
-                .where(AgentSession.is_processed.is_(True))
-            )).scalar()
-
-            # Turn counts
-            total_turns = (await session.execute(
-                select(func.count()).select_from(AgentTurn)
-            )).scalar()
-
-            summarized_turns = (await session.execute(
-                select(func.count()).select_from(AgentTurn)
-                .where(AgentTurn.assistant_summary.isnot(None))
-            )).scalar()
-
-            # Entity counts
-            total_entities = (await session.execute(
-                select(func.count()).select_from(AgentTurnEntity)
-            )).scalar()
+            # All recording counts in a single round-trip
+            (
+                total_sessions,
+                processed_sessions,
+                total_turns,
+                summarized_turns,
+                total_entities,
+            ) = (await session.execute(text("""
+                SELECT
+                    (SELECT count(*) FROM agent_sessions),
+                    (SELECT count(*) FROM agent_sessions WHERE is_processed),
+                    (SELECT count(*) FROM agent_turns),
+                    (SELECT count(*) FROM agent_turns WHERE assistant_summary IS NOT NULL),
+                    (SELECT count(*) FROM agent_turn_entities)
+            """))).one()
 
             # Job stats
             job_stats = await get_job_stats(session)
 
+        rows = [
+            ("Sessions (total)", total_sessions),
+            ("Sessions (processed)", processed_sessions),
+            ("Turns (total)", total_turns),
+            ("Turns (summarized)", summarized_turns),
+            ("Entity links", total_entities),
+        ]
+
+        # Piped output: plain TSV, skipping rich's table layout entirely
+        if not console.is_terminal:
+            for metric, count in rows:
+                print(f"{metric}\t{count}")
+            for status, count in sorted(job_stats.items()):
+                print(f"Jobs ({status})\t{count}")
+            return
+
         console.print("\n[bold]Context System Stats[/bold]\n")
 
         table = Table()
         table.add_column("Metric", style="cyan")
         table.add_column("Count", style="green", justify="right")
 
-        table.add_row("Sessions (total)", str(total_sessions))
-        table.add_row("Sessions (processed)", str(processed_sessions))
-        table.add_row("Turns (total)", str(total_turns))
-        table.add_row("Turns (summarized)", str(summarized_turns))
-        table.add_row("Entity links", str(total_entities))
+        for metric, count in rows:
+            table.add_row(metric, str(count))
 
         console.print(table)
 
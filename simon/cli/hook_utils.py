@@ -0,0 +1,28 @@
+"""Helpers shared by the Claude Code hook entry points."""
+
+import asyncio
+from typing import Any, Coroutine, TypeVar
+
+T = TypeVar("T")
+
+
+def fast_run(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on a fresh event loop with minimal setup/teardown.
+
+    Unlike asyncio.run, this skips installing the loop as current,
+    cancelling leftover tasks, and shutting down async generators and the
+    default executor. Hook processes exit right after, so that cleanup is
+    wasted work on a tight latency budget. Don't use this in long-lived
+    processes.
+
+    Args:
+        coro: The coroutine to run.
+
+    Returns:
+        The coroutine's result.
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
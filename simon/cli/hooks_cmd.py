@@ -1,10 +1,12 @@
 """CLI commands for installing/managing Claude Code hooks."""
 
+import functools
 import json
 import logging
+import os
+import re
 import shutil
 import sys
-import tempfile
 from pathlib import Path
 from typing import Optional
 
@@ -18,15 +20,18 @@ app = typer.Typer(no_args_is_help=True)
 
 CLAUDE_SETTINGS_PATH = Path.home() / ".claude" / "settings.json"
 
-# Marker to identify Simon hooks in settings.json
-SIMON_HOOK_MARKER = "simon "
+# Identifies Simon hooks in settings.json, both bare ('simon retrieve --hook')
+# and bash-wrapped ('bash -c '/path/to/simon record --hook ...')
+_SIMON_CMD_RE = re.compile(r"\bsimon\s+(?:record|retrieve)\b")
 
 
+@functools.lru_cache(maxsize=1)
 def _get_simon_bin() -> str:
     """Find the full path to the simon binary.
 
     Checks in order: shutil.which, the venv bin dir alongside
-    the running Python, then falls back to bare 'simon'.
+    the running Python, then falls back to bare 'simon'. Cached so
+    $PATH is walked at most once per process.
     """
     found = shutil.which("simon")
     if found:
@@ -85,30 +90,47 @@ def get_simon_hooks() -> dict:
     }
 
 
-def _read_settings() -> dict:
-    """Read existing Claude Code settings.json."""
+def _read_settings_bytes() -> bytes:
+    """Read raw settings.json bytes, or b"" if missing/unreadable."""
     if CLAUDE_SETTINGS_PATH.exists():
         try:
-            return json.loads(CLAUDE_SETTINGS_PATH.read_text())
-        except (json.JSONDecodeError, OSError) as e:
+            return CLAUDE_SETTINGS_PATH.read_bytes()
+        except OSError as e:
             logger.warning("Failed to read settings.json: %s", e)
-    return {}
+    return b""
+
+
+def _parse_settings(raw: bytes) -> dict:
+    """Parse raw settings.json bytes, returning {} on empty or invalid input."""
+    if not raw:
+        return {}
+    try:
+        return json.loads(raw)
+    except json.JSONDecodeError as e:
+        logger.warning("Failed to read settings.json: %s", e)
+        return {}
+
+
+def _read_settings() -> dict:
+    """Read existing Claude Code settings.json."""
+    return _parse_settings(_read_settings_bytes())
 
 
 def _write_settings(settings: dict) -> None:
-    """Write settings.json atomically (temp file + rename)."""
+    """Write settings.json atomically and durably (temp file + fsync + replace)."""
     CLAUDE_SETTINGS_PATH.parent.mkdir(parents=True, exist_ok=True)
 
-    # Atomic write: write to temp, then rename
-    tmp_fd, tmp_path = tempfile.mkstemp(
-        dir=CLAUDE_SETTINGS_PATH.parent,
-        suffix=".tmp",
-    )
+    data = json.dumps(settings, indent=2).encode() + b"\n"
+    tmp_path = f"{CLAUDE_SETTINGS_PATH}.tmp"
+
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
     try:
-        with open(tmp_fd, "w") as f:
-            json.dump(settings, f, indent=2)
-            f.write("\n")
-        Path(tmp_path).rename(CLAUDE_SETTINGS_PATH)
+        try:
+            os.write(fd, data)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, CLAUDE_SETTINGS_PATH)
     except Exception:
         Path(tmp_path).unlink(missing_ok=True)
         raise
@@ -126,12 +148,7 @@ def _is_simon_command(cmd: str) -> bool:
     Returns:
         True if this is a Simon hook command.
     """
-    if SIMON_HOOK_MARKER in cmd:
-        return True
-    # Check for the binary name in bash-wrapped commands
-    if "simon" in cmd and ("record" in cmd or "retrieve" in cmd):
-        return True
-    return False
+    return _SIMON_CMD_RE.search(cmd) is not None
 
 
 def _has_simon_hook(hook_entries: list) -> bool:
@@ -211,7 +228,13 @@ def uninstall_hooks(
     if verbose:
         logging.basicConfig(level=logging.DEBUG)
 
-    settings = _read_settings()
+    # Cheap substring check first: no mention of simon means nothing to remove
+    raw = _read_settings_bytes()
+    if b"simon" not in raw:
+        console.print("\n[dim]No Simon hooks found to remove.[/dim]")
+        return
+
+    settings = _parse_settings(raw)
     hooks = settings.get("hooks", {})
 
     removed = 0
@@ -225,10 +248,9 @@ def uninstall_hooks(
             removed += 1
             console.print(f"  [red]Removed[/red] {event_name} hook")
 
-    settings["hooks"] = hooks
-    _write_settings(settings)
-
     if removed:
+        settings["hooks"] = hooks
+        _write_settings(settings)
         console.print(f"\n[bold]Removed {removed} Simon hooks[/bold]")
     else:
         console.print("\n[dim]No Simon hooks found to remove.[/dim]")
@@ -247,8 +269,9 @@ def hooks_status(
         console.print("Run [cyan]simon hooks install[/cyan] to set up hooks.")
         return
 
-    settings = _read_settings()
-    hooks = settings.get("hooks", {})
+    # Skip the JSON parse entirely when simon isn't mentioned anywhere
+    raw = _read_settings_bytes()
+    hooks = _parse_settings(raw).get("hooks", {}) if b"simon" in raw else {}
 
     console.print(f"\n[bold]Simon Hook Status[/bold]  ({CLAUDE_SETTINGS_PATH})\n")
 
@@ -1,5 +1,7 @@
 """CLI entry point for simon."""
 
+import importlib
+
 import typer
 
 app = typer.Typer(
@@ -8,21 +10,45 @@ app = typer.Typer(
     no_args_is_help=True,
 )
 
+# Subcommand name -> (module path, help text). Modules are imported only
+# when their subcommand is invoked, so hook paths don't pay for siblings.
+_SUBCOMMANDS = {
+    "hooks": ("simon.cli.hooks_cmd", "Install/manage Claude Code hooks"),
+    "retrieve": ("simon.cli.retrieve_cmd", "Retrieve context"),
+    "record": ("simon.cli.record_cmd", "Record conversations"),
+    "context": ("simon.cli.context_cmd", "Query and debug context system"),
+    "skill": ("simon.cli.skill_cmd", "Manage Claude Code skills"),
+    "worker": ("simon.cli.worker_cmd", "Background worker management"),
+}
+
+
+def _register_lazy_subcommand(name: str, module: str, help_text: str) -> None:
+    """Register a stub command that imports and runs the real sub-app on use.
+
+    The stub forwards all remaining arguments (including --help) to the
+    sub-app, so its options and nested commands behave as if it had been
+    added with add_typer.
+
+    Args:
+        name: Subcommand name (e.g., 'record').
+        module: Module path exposing a Typer ``app``.
+        help_text: Help shown in the top-level command list.
+    """
+
+    @app.command(
+        name,
+        help=help_text,
+        add_help_option=False,
+        context_settings={"allow_extra_args": True, "ignore_unknown_options": True},
+    )
+    def _dispatch(ctx: typer.Context) -> None:
+        sub_app = importlib.import_module(module).app
+        sub_app(args=ctx.args, prog_name=f"{ctx.find_root().info_name} {name}")
+
 
 def main():
-    from simon.cli.hooks_cmd import app as hooks_app
-    from simon.cli.retrieve_cmd import app as retrieve_app
-    from simon.cli.record_cmd import app as record_app
-    from simon.cli.context_cmd import app as context_app
-    from simon.cli.skill_cmd import app as skill_app
-    from simon.cli.worker_cmd import app as worker_app
-
-    app.add_typer(hooks_app, name="hooks", help="Install/manage Claude Code hooks")
-    app.add_typer(retrieve_app, name="retrieve", help="Retrieve context")
-    app.add_typer(record_app, name="record", help="Record conversations")
-    app.add_typer(context_app, name="context", help="Query and debug context system")
-    app.add_typer(skill_app, name="skill", help="Manage Claude Code skills")
-    app.add_typer(worker_app, name="worker", help="Background worker management")
+    for name, (module, help_text) in _SUBCOMMANDS.items():
+        _register_lazy_subcommand(name, module, help_text)
 
     app()
 
@@ -3,18 +3,20 @@
 import asyncio
 import json
 import logging
+import os
 import sys
 from pathlib import Path
 from typing import Optional
 
 import typer
-from rich.console import Console
 
 logger = logging.getLogger(__name__)
-console = Console()
 
 app = typer.Typer(invoke_without_command=True)
 
+# Max transcripts recorded concurrently by --all
+_RECORD_CONCURRENCY = 8
+
 
 @app.callback(invoke_without_command=True)
 def record(
@@ -29,7 +31,7 @@ def record(
     elif all_sessions:
         _record_all(verbose)
     else:
-        console.print("Usage: simon record --hook (for Claude Code) or --all (scan all sessions)")
+        typer.echo("Usage: simon record --hook (for Claude Code) or --all (scan all sessions)")
 
 
 def _hook_record():
@@ -50,13 +52,11 @@ def _hook_record():
     if not session_id or not transcript_path:
         sys.exit(0)
 
-    async def _enqueue():
-        from simon.context.recorder import enqueue_session_recording
-
-        await enqueue_session_recording(session_id, transcript_path, cwd)
+    from simon.cli.hook_utils import fast_run
+    from simon.storage.fast_enqueue import enqueue_session_recording_fast
 
     try:
-        asyncio.run(_enqueue())
+        fast_run(enqueue_session_recording_fast(session_id, transcript_path, cwd))
     except Exception:
         pass
 
@@ -65,6 +65,9 @@ def _hook_record():
 
 def _record_all(verbose: bool):
     """Scan all Claude Code sessions and record unprocessed ones."""
+    from rich.console import Console
+
+    console = Console()
     if verbose:
         logging.basicConfig(level=logging.DEBUG)
 
@@ -72,7 +75,7 @@ def _record_all(verbose: bool):
         from sqlalchemy import select
 
         from simon.context.recorder import record_session
-        from simon.ingestion.claude_code import CLAUDE_SESSIONS_DIR
+        from simon.ingestion.claude_code import CLAUDE_SESSIONS_DIR, read_session_cwd
         from simon.storage.db import get_session
         from simon.storage.models import AgentSession
 
@@ -81,11 +84,19 @@ def _record_all(verbose: bool):
             console.print(f"[yellow]No sessions directory: {base_dir}[/yellow]")
             return
 
-        # Collect all JSONL files
-        jsonl_files = []
-        for project_dir in base_dir.iterdir():
-            if project_dir.is_dir():
-                jsonl_files.extend(sorted(project_dir.glob("*.jsonl")))
+        # Collect all JSONL files as (project_dir, session_id, path) tuples;
+        # scandir exposes names and types without a stat per entry
+        jsonl_files: list[tuple[str, str, str]] = []
+        with os.scandir(base_dir) as projects:
+            for project_entry in projects:
+                if not project_entry.is_dir(follow_symlinks=False):
+                    continue
+                with os.scandir(project_entry.path) as entries:
+                    jsonl_files.extend(sorted(
+                        (project_entry.name, entry.name[:-6], entry.path)
+                        for entry in entries
+                        if entry.name.endswith(".jsonl")
+                    ))
 
         if not jsonl_files:
             console.print("[yellow]No session files found.[/yellow]")
@@ -93,29 +104,51 @@ def _record_all(verbose: bool):
 
         console.print(f"Found {len(jsonl_files)} session files")
 
+        # One query for every already-processed session, then filter locally
+        async with get_session() as session:
+            result = await session.execute(
+                select(AgentSession.session_id).where(AgentSession.is_processed.is_(True))
+            )
+            processed_ids = set(result.scalars().all())
+
+        pending_files = [f for f in jsonl_files if f[1] not in processed_ids]
+        already_processed = len(jsonl_files) - len(pending_files)
+        jsonl_files = pending_files
+
+        sem = asyncio.Semaphore(_RECORD_CONCURRENCY)
+
+        async def _record_one(project_dir: str, session_id: str, transcript_path: str) -> dict:
+            # The project dir name is Claude's mangled cwd (e.g.
+            # -home-user-proj); store the real cwd from the transcript so
+            # workspace matching works like it does for hook-recorded sessions
+            workspace_path = read_session_cwd(Path(transcript_path)) or project_dir
+            # AsyncSession isn't safe for concurrent use, so each task
+            # gets its own; the semaphore keeps us within the pool size
+            async with sem, get_session() as session:
+                return await record_session(
+                    session=session,
+                    session_id=session_id,
+                    transcript_path=transcript_path,
+                    workspace_path=workspace_path,
+                )
+
+        results = await asyncio.gather(
+            *(_record_one(*f) for f in jsonl_files),
+            return_exceptions=True,
+        )
+
         recorded = 0
-        skipped = 0
+        skipped = already_processed
         errors = 0
 
-        for jsonl_file in jsonl_files:
-            session_id = jsonl_file.stem
-            workspace_path = jsonl_file.parent.name
-
-            try:
-                async with get_session() as session:
-                    result = await record_session(
-                        session=session,
-                        session_id=session_id,
-                        transcript_path=str(jsonl_file),
-                        workspace_path=workspace_path,
-                    )
-                    if result["turns_recorded"] > 0:
-                        recorded += 1
-                    else:
-                        skipped += 1
-            except Exception as e:
-                logger.error("Failed to record %s: %s", session_id[:12], e)
+        for (_, session_id, _), result in zip(jsonl_files, results):
+            if isinstance(result, BaseException):
+                logger.error("Failed to record %s: %s", session_id[:12], result)
                 errors += 1
+            elif result["turns_recorded"] > 0:
+                recorded += 1
+            else:
+                skipped += 1
 
         console.print(f"\n[bold green]Recording complete![/bold green]")
         console.print(f"  Recorded: {recorded}")
@@ -7,10 +7,21 @@ import sys
 from typing import Optional
 
 import typer
-from rich.console import Console
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:  # optional speedup, see the "speedups" extra
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
 
 logger = logging.getLogger(__name__)
-console = Console()
 
 app = typer.Typer(invoke_without_command=True)
 
@@ -29,7 +40,7 @@ def retrieve(
     elif query:
         _manual_retrieve(query, cwd, max_tokens, verbose)
     else:
-        console.print("Usage: simon retrieve --hook (for Claude Code) or --query (for testing)")
+        typer.echo("Usage: simon retrieve --hook (for Claude Code) or --query (for testing)")
 
 
 def _hook_retrieve():
@@ -38,26 +49,30 @@ def _hook_retrieve():
     This entire path must complete in <2 seconds.
     """
     try:
-        input_data = json.loads(sys.stdin.read())
-    except (json.JSONDecodeError, ValueError):
+        input_data = _json_loads(sys.stdin.buffer.read())
+    except ValueError:  # includes json/orjson decode errors
         sys.exit(0)
 
     prompt = input_data.get("prompt", "")
     cwd = input_data.get("cwd", "")
 
-    if not prompt:
+    # The classifier ignores prompts this short, so bail before importing it
+    if not prompt or len(prompt.strip()) < 3:
         sys.exit(0)
 
-    async def _retrieve():
-        from simon.context.classifier import PromptClassifier
-        from simon.context.formatter import format_context_blocks
-        from simon.context.retriever import ContextRetriever
+    # Check settings before importing the classifier/retriever/SQLAlchemy stack
+    try:
         from simon.config import get_settings
-        from simon.storage.db import get_session
 
         settings = get_settings()
-        if not settings.context.enabled or not settings.context.retrieval_enabled:
-            return ""
+    except Exception:
+        sys.exit(0)
+    if not settings.context.enabled or not settings.context.retrieval_enabled:
+        sys.exit(0)
+
+    async def _retrieve():
+        from simon.context.classifier import PromptClassifier
+        from simon.storage.db import get_session, get_session_factory
 
         async with get_session() as session:
             classifier = PromptClassifier()
@@ -68,15 +83,20 @@ def _hook_retrieve():
             if classification.confidence < 0.1:
                 return ""
 
+            from simon.context.formatter import format_context_blocks
+            from simon.context.retriever import ContextRetriever
+
             retriever = ContextRetriever()
             blocks = await retriever.retrieve(
-                session, classification, max_tokens=settings.context.max_context_tokens
+                get_session_factory(), classification, max_tokens=settings.context.max_context_tokens
             )
 
             return format_context_blocks(blocks, max_tokens=settings.context.max_context_tokens)
 
+    from simon.cli.hook_utils import fast_run
+
     try:
-        context_text = asyncio.run(_retrieve())
+        context_text = fast_run(_retrieve())
     except Exception:
         sys.exit(0)
 
@@ -87,13 +107,17 @@ def _hook_retrieve():
                 "additionalContext": context_text,
             }
         }
-        print(json.dumps(output))
+        sys.stdout.buffer.write(_json_dumps(output) + b"\n")
+        sys.stdout.flush()
 
     sys.exit(0)
 
 
 def _manual_retrieve(query: str, cwd: Optional[str], max_tokens: int, verbose: bool):
     """Manual mode for testing retrieval."""
+    from rich.console import Console
+
+    console = Console()
     if verbose:
         logging.basicConfig(level=logging.DEBUG)
 
@@ -101,7 +125,7 @@ def _manual_retrieve(query: str, cwd: Optional[str], max_tokens: int, verbose: b
         from simon.context.classifier import PromptClassifier
         from simon.context.formatter import format_context_blocks
         from simon.context.retriever import ContextRetriever
-        from simon.storage.db import get_session
+        from simon.storage.db import get_session, get_session_factory
 
         async with get_session() as session:
             classifier = PromptClassifier()
@@ -121,7 +145,7 @@ def _manual_retrieve(query: str, cwd: Optional[str], max_tokens: int, verbose: b
                 return
 
             retriever = ContextRetriever()
-            blocks = await retriever.retrieve(session, classification, max_tokens=max_tokens)
+            blocks = await retriever.retrieve(get_session_factory(), classification, max_tokens=max_tokens)
 
             console.print(f"\n[bold]Retrieved {len(blocks)} context blocks:[/bold]")
             for block in blocks:
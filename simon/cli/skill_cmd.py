@@ -6,14 +6,16 @@ from pathlib import Path
 from typing import Optional
 
 import typer
-from rich.console import Console
-from rich.table import Table
+
+from simon.cli.console import get_console
 
 logger = logging.getLogger(__name__)
-console = Console()
 
 app = typer.Typer(no_args_is_help=True)
 
+# Max sessions analyzed (and skills generated) concurrently by auto-scan
+_AUTO_SCAN_CONCURRENCY = 8
+
 
 @app.command("create")
 def create_skill(
@@ -31,15 +33,22 @@ async def _create(description: str, scope: str, name: Optional[str], verbose: bo
     from simon.skills.generator import GeneratedSkill, SkillContext, generate_skill_md
     from simon.skills.installer import install_skill
 
+    console = get_console()
+
     console.print(f"[bold]Generating skill:[/bold] {description}")
 
     # Build context from current directory
     context = SkillContext(workspace_path=str(Path.cwd()))
 
     # Try to read CLAUDE.md for conventions
+    # Only the first 1000 bytes are used, so don't read the whole file;
+    # errors="ignore" drops a multi-byte character cut off at the end
     claude_md = Path.cwd() / "CLAUDE.md"
-    if claude_md.exists():
-        context.conventions = claude_md.read_text()[:1000]
+    try:
+        with claude_md.open("rb") as f:
+            context.conventions = f.read(1000).decode("utf-8", errors="ignore")
+    except FileNotFoundError:
+        pass
 
     skill = await generate_skill_md(description, context, source="manual")
     if not skill:
@@ -77,8 +86,12 @@ def list_skills(
     scope: str = typer.Option("all", "--scope", "-s", help="personal, project, or all"),
 ):
     """List installed Claude Code skills."""
+    from rich.table import Table
+
     from simon.skills.installer import list_installed_skills
 
+    console = get_console()
+
     skills = list_installed_skills(
         scope=scope,
         project_path=Path.cwd() if scope in ("project", "all") else None,
@@ -113,6 +126,8 @@ def show_skill(
     """Show the contents of an installed skill."""
     from simon.skills.installer import list_installed_skills
 
+    console = get_console()
+
     skills = list_installed_skills(
         scope=scope,
         project_path=Path.cwd() if scope in ("project", "all") else None,
@@ -137,6 +152,8 @@ def uninstall(
     """Remove an installed skill."""
     from simon.skills.installer import uninstall_skill
 
+    console = get_console()
+
     removed = uninstall_skill(
         name=name,
         scope=scope,
@@ -162,8 +179,11 @@ def search(
 
 async def _search(query: str, source: Optional[str], verbose: bool) -> None:
     """Async implementation of skill search."""
+    from rich.table import Table
+
     from simon.skills.registry import search_skills
 
+    console = get_console()
     console.print(f"[bold]Searching for:[/bold] {query}")
 
     sources = [source] if source else None
@@ -206,6 +226,8 @@ async def _install(source: str, scope: str, force: bool) -> None:
     from simon.skills.installer import install_skill
     from simon.skills.registry import fetch_skill_from_github
 
+    console = get_console()
+
     # Parse source into repo + path
     parts = source.split("/", 2)
     if len(parts) < 3:
@@ -260,6 +282,8 @@ async def _auto_scan(dry_run: bool, min_quality: float) -> None:
     from simon.storage.db import get_session
     from simon.storage.models import AgentSession
 
+    console = get_console()
+
     async with get_session() as session:
         result = await session.execute(
             select(AgentSession)
@@ -274,12 +298,24 @@ async def _auto_scan(dry_run: bool, min_quality: float) -> None:
         console.print("[dim]No processed sessions found.[/dim]")
         return
 
+    sem = asyncio.Semaphore(_AUTO_SCAN_CONCURRENCY)
+
+    async def _analyze_one(agent_session):
+        # AsyncSession isn't safe for concurrent use, so each task gets its own
+        async with sem, get_session() as db_session:
+            return await analyze_session_for_skill(db_session, agent_session)
+
+    results = await asyncio.gather(
+        *(_analyze_one(s) for s in sessions),
+        return_exceptions=True,
+    )
+
     candidates = []
-    async with get_session() as db_session:
-        for agent_session in sessions:
-            candidate = await analyze_session_for_skill(db_session, agent_session)
-            if candidate and candidate.quality_score >= min_quality:
-                candidates.append(candidate)
+    for agent_session, candidate in zip(sessions, results):
+        if isinstance(candidate, BaseException):
+            logger.error("Failed to analyze %s: %s", agent_session.session_id[:12], candidate)
+        elif candidate and candidate.quality_score >= min_quality:
+            candidates.append(candidate)
 
     if not candidates:
         console.print("[dim]No sessions qualified for skill generation.[/dim]")
@@ -298,11 +334,20 @@ async def _auto_scan(dry_run: bool, min_quality: float) -> None:
         console.print("\n[dim]Dry run — no skills generated.[/dim]")
         return
 
-    for c in candidates:
-        skill = await generate_skill_md(c.description, c.context, source="auto")
+    async def _generate_one(c):
+        async with sem:
+            return await generate_skill_md(c.description, c.context, source="auto")
+
+    skills = await asyncio.gather(*(_generate_one(c) for c in candidates))
+
+    # Install one at a time so two candidates that produce the same skill
+    # name still hit the FileExistsError check
+    for skill in skills:
         if skill:
             try:
-                path = install_skill(name=skill.name, content=skill.full_content)
+                path = await asyncio.to_thread(
+                    install_skill, name=skill.name, content=skill.full_content,
+                )
                 console.print(f"[green]Generated skill '{skill.name}' at {path}[/green]")
             except (FileExistsError, ValueError) as e:
                 console.print(f"[yellow]Skipped: {e}[/yellow]")
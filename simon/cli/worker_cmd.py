@@ -7,14 +7,15 @@ import signal
 from pathlib import Path
 
 import typer
-from rich.console import Console
+
+from simon.cli.console import get_console
 
 logger = logging.getLogger(__name__)
-console = Console()
 
 app = typer.Typer(no_args_is_help=True)
 
 PID_FILE = Path.home() / ".config" / "simon" / "worker.pid"
+LOG_FILE = Path.home() / ".config" / "simon" / "worker.log"
 
 
 @app.command("start")
@@ -34,32 +35,78 @@ def start_worker(
     if daemon_mode:
         _start_daemon(poll_interval)
     else:
-        console.print("[bold]Starting context worker[/bold] (Ctrl+C to stop)")
+        get_console().print("[bold]Starting context worker[/bold] (Ctrl+C to stop)")
         asyncio.run(run_worker(poll_interval=poll_interval))
 
 
 def _start_daemon(poll_interval: float):
-    """Fork into a background daemon."""
+    """Detach into a background daemon using the classic double fork.
+
+    The first child starts a new session; the second (the actual worker)
+    is not a session leader, so it can never reacquire a controlling
+    terminal or be hung up when the launching terminal closes. Its PID is
+    passed back to the parent over a pipe for the PID file.
+    """
+    console = get_console()
+
+    if not hasattr(os, "fork"):
+        console.print("[red]--daemon is only supported on POSIX systems.[/red]")
+        raise typer.Exit(1)
+
+    read_fd, write_fd = os.pipe()
     pid = os.fork()
     if pid > 0:
-        # Parent process
+        # Parent process: reap the intermediate child, then learn the worker's PID
+        os.close(write_fd)
+        os.waitpid(pid, 0)
+        with os.fdopen(read_fd) as pipe:
+            worker_pid = int(pipe.read() or 0)
+
+        if not worker_pid:
+            console.print("[red]Failed to start worker daemon.[/red]")
+            raise typer.Exit(1)
+
         PID_FILE.parent.mkdir(parents=True, exist_ok=True)
-        PID_FILE.write_text(str(pid))
-        console.print(f"[green]Worker started[/green] (PID: {pid})")
+        PID_FILE.write_text(str(worker_pid))
+        console.print(f"[green]Worker started[/green] (PID: {worker_pid})")
         console.print(f"  PID file: {PID_FILE}")
+        console.print(f"  Log file: {LOG_FILE}")
         return
 
-    # Child process
+    # First child: new session, then fork again and exit
+    os.close(read_fd)
     os.setsid()
+    if os.fork() > 0:
+        os._exit(0)
+
+    # Worker process
+    os.write(write_fd, str(os.getpid()).encode())
+    os.close(write_fd)
+
+    os.chdir("/")
+    os.umask(0o022)
+    LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
+    devnull = os.open(os.devnull, os.O_RDONLY)
+    log_fd = os.open(LOG_FILE, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+    os.dup2(devnull, 0)
+    os.dup2(log_fd, 1)
+    os.dup2(log_fd, 2)
+    os.close(devnull)
+    os.close(log_fd)
 
     from simon.context.worker import run_worker
 
-    asyncio.run(run_worker(poll_interval=poll_interval))
+    try:
+        asyncio.run(run_worker(poll_interval=poll_interval))
+    finally:
+        os._exit(0)
 
 
 @app.command("stop")
 def stop_worker():
     """Stop the Simon context worker."""
+    console = get_console()
+
     if not PID_FILE.exists():
         console.print("[yellow]No worker PID file found. Worker may not be running.[/yellow]")
         return
@@ -82,6 +129,8 @@ def worker_status(
     verbose: bool = typer.Option(False, "--verbose", "-v"),
 ):
     """Show worker status and job queue stats."""
+    console = get_console()
+
     # Check if worker is running
     running = False
     pid = None
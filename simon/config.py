@@ -1,25 +1,40 @@
 """Configuration management for simon."""
 
+import dataclasses
+import functools
 import os
+import tomllib
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
-from pydantic import Field
-from pydantic_settings import BaseSettings, SettingsConfigDict
+DEFAULT_CONFIG_PATH = Path.home() / ".config/simon/config.toml"
 
+# PostgreSQL settings applied to every asyncpg connection at startup.
+# Hook sessions run a handful of small queries where JIT compilation
+# costs more than it saves.
+DB_SERVER_SETTINGS = {
+    "application_name": "simon",
+    "jit": "off",
+}
 
-class GeneralSettings(BaseSettings):
-    db_url: str = Field(default="postgresql+asyncpg://localhost/simon")
+
+@dataclass
+class GeneralSettings:
+    db_url: str = "postgresql+asyncpg://localhost/simon"
     log_level: str = "INFO"
 
 
-class AnthropicSettings(BaseSettings):
-    model_config = SettingsConfigDict(env_prefix="ANTHROPIC_")
+@dataclass
+class AnthropicSettings:
+    env_prefix = "ANTHROPIC_"
+
     api_key: str = ""
     model: str = "claude-haiku-4-5-20251001"
 
 
-class ContextSettings(BaseSettings):
+@dataclass
+class ContextSettings:
     """Settings for the context recording and retrieval system."""
 
     enabled: bool = True
@@ -29,11 +44,13 @@ class ContextSettings(BaseSettings):
     recording_timeout_ms: int = 200
     max_context_tokens: int = 1500
     turn_summary_model: str = "claude-haiku-4-5-20251001"
+    turn_summary_concurrency: int = 4
     session_summary_model: str = "claude-haiku-4-5-20251001"
     worker_poll_interval: float = 2.0
 
 
-class SkillSettings(BaseSettings):
+@dataclass
+class SkillSettings:
     """Settings for the skills system."""
 
     auto_generate: bool = True
@@ -44,41 +61,107 @@ class SkillSettings(BaseSettings):
     github_token: str = ""
 
 
-class Settings(BaseSettings):
+_TRUE_STRINGS = frozenset({"1", "true", "t", "yes", "y", "on"})
+_FALSE_STRINGS = frozenset({"0", "false", "f", "no", "n", "off"})
+
+
+def _coerce(value: Any, type_: type, name: str) -> Any:
+    """Convert a TOML or env value to a settings field's declared type.
+
+    Raises:
+        ValueError: If the value can't be converted.
+    """
+    if type_ is bool:
+        if isinstance(value, bool):
+            return value
+        lowered = str(value).strip().lower()
+        if lowered in _TRUE_STRINGS:
+            return True
+        if lowered in _FALSE_STRINGS:
+            return False
+        raise ValueError(f"Invalid boolean for {name}: {value!r}")
+    if type_ is int and isinstance(value, bool):
+        raise ValueError(f"Invalid integer for {name}: {value!r}")
+    try:
+        return type_(value)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid value for {name}: {value!r}") from e
+
+
+def _build_section(section_cls: type, data: Optional[dict] = None) -> Any:
+    """Build a settings section from config values and the environment.
+
+    Config file values take precedence over environment variables, which
+    take precedence over defaults. Env vars are matched case-insensitively
+    as the field name plus the section's env_prefix, if any.
+
+    Args:
+        section_cls: One of the settings section dataclasses.
+        data: Values from the matching config.toml table.
+
+    Returns:
+        An instance of section_cls.
+
+    Raises:
+        ValueError: On unknown keys or values of the wrong type.
+    """
+    data = data or {}
+    fields = {f.name: f for f in dataclasses.fields(section_cls)}
+
+    unknown = set(data) - set(fields)
+    if unknown:
+        raise ValueError(f"Unknown {section_cls.__name__} keys: {', '.join(sorted(unknown))}")
+
+    prefix = getattr(section_cls, "env_prefix", "").lower()
+    environ = {key.lower(): value for key, value in os.environ.items()}
+
+    values = {}
+    for name, f in fields.items():
+        if name in data:
+            values[name] = _coerce(data[name], f.type, name)
+        elif f"{prefix}{name}" in environ:
+            values[name] = _coerce(environ[f"{prefix}{name}"], f.type, name)
+
+    return section_cls(**values)
+
+
+@dataclass
+class Settings:
     """Top-level settings assembled from subsections."""
 
-    general: GeneralSettings = Field(default_factory=GeneralSettings)
-    anthropic: AnthropicSettings = Field(default_factory=AnthropicSettings)
-    context: ContextSettings = Field(default_factory=ContextSettings)
-    skills: SkillSettings = Field(default_factory=SkillSettings)
+    general: GeneralSettings = field(default_factory=lambda: _build_section(GeneralSettings))
+    anthropic: AnthropicSettings = field(default_factory=lambda: _build_section(AnthropicSettings))
+    context: ContextSettings = field(default_factory=lambda: _build_section(ContextSettings))
+    skills: SkillSettings = field(default_factory=lambda: _build_section(SkillSettings))
 
     @classmethod
     def load(cls, config_path: Optional[Path] = None) -> "Settings":
-        """Load settings from TOML config file, falling back to defaults."""
-        if config_path is None:
-            config_path = Path.home() / ".config/simon/config.toml"
+        """Load settings from TOML config file, falling back to defaults.
 
-        if config_path.exists():
-            import toml
+        Args:
+            config_path: Path to config.toml. Defaults to ~/.config/simon/config.toml.
 
-            data = toml.load(config_path)
-            return cls(
-                general=GeneralSettings(**data.get("general", {})),
-                anthropic=AnthropicSettings(**data.get("anthropic", {})),
-                context=ContextSettings(**data.get("context", {})),
-                skills=SkillSettings(**data.get("skills", {})),
-            )
-
-        return cls()
+        Returns:
+            The loaded Settings.
+        """
+        if config_path is None:
+            config_path = DEFAULT_CONFIG_PATH
 
+        try:
+            with open(config_path, "rb") as f:
+                data = tomllib.load(f)
+        except FileNotFoundError:
+            return cls()
 
-# Module-level singleton
-_settings: Optional[Settings] = None
+        return cls(
+            general=_build_section(GeneralSettings, data.get("general")),
+            anthropic=_build_section(AnthropicSettings, data.get("anthropic")),
+            context=_build_section(ContextSettings, data.get("context")),
+            skills=_build_section(SkillSettings, data.get("skills")),
+        )
 
 
+@functools.lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Get or create the global settings instance."""
-    global _settings
-    if _settings is None:
-        _settings = Settings.load()
-    return _settings
+    return Settings.load()
@@ -7,22 +7,31 @@ that happened in a conversation turn.
 import json
 import logging
 import re
+from collections.abc import Mapping
 from dataclasses import dataclass, field
-from typing import Optional
+from functools import lru_cache
+from itertools import chain
+from types import MappingProxyType
+from typing import Any, Callable, Optional
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # optional speedup, see the "speedups" extra
+    _json_loads = json.loads
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class Artifact:
     """A single artifact extracted from a turn."""
 
     artifact_type: str  # file_read, file_write, file_edit, command, error, tool_call
     artifact_value: str  # The primary value (file path, command string, error message)
-    artifact_metadata: dict = field(default_factory=dict)
+    artifact_metadata: Mapping[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class TurnArtifacts:
     """All artifacts extracted from a single turn's raw JSONL."""
 
@@ -37,25 +46,18 @@ class TurnArtifacts:
     @property
     def files_touched(self) -> list[str]:
         """All unique files touched (read, written, edited)."""
-        seen = set()
-        result = []
-        for f in self.files_read + self.files_written + self.files_edited:
-            if f not in seen:
-                seen.add(f)
-                result.append(f)
-        return result
+        return list(dict.fromkeys(chain(self.files_read, self.files_written, self.files_edited)))
 
 
-# Tool name to artifact type mapping
-_TOOL_TYPE_MAP = {
-    "Read": "file_read",
-    "Glob": "file_read",
-    "Grep": "file_read",
-    "Write": "file_write",
-    "Edit": "file_edit",
-    "NotebookEdit": "file_edit",
-    "Bash": "command",
-}
+# File paths in free text: absolute paths (/path/to/file.ext) and relative
+# paths under common source roots (src/module/file.py), in a single pass
+_FILE_PATH_RE = re.compile(
+    r'(?<!\w)(/[\w./-]+\.\w+|(?:src|tests|lib|app|pkg)/[\w./-]+\.\w+)'
+)
+
+
+# Content block types that carry artifacts
+_TOOL_BLOCK_TYPES = frozenset({"tool_use", "tool_result"})
 
 
 def extract_artifacts(raw_jsonl: str) -> TurnArtifacts:
@@ -75,14 +77,25 @@ def extract_artifacts(raw_jsonl: str) -> TurnArtifacts:
     if not raw_jsonl:
         return result
 
-    for line in raw_jsonl.split("\n"):
-        line = line.strip()
-        if not line:
+    # Encode once and walk the bytes line by line (both decoders accept
+    # bytes directly) rather than materializing a list of every line
+    data = raw_jsonl.encode()
+    n = len(data)
+    start = 0
+    while start < n:
+        end = data.find(b"\n", start)
+        if end == -1:
+            end = n
+        line = data[start:end]
+        start = end + 1
+        # Lines without tool blocks (plain conversation) can't yield
+        # artifacts, so don't bother decoding them
+        if b'"tool_' not in line:
             continue
 
         try:
-            obj = json.loads(line)
-        except json.JSONDecodeError:
+            obj = _json_loads(line)
+        except ValueError:  # json/orjson decode errors
             continue
 
         message = obj.get("message", {})
@@ -94,17 +107,106 @@ def extract_artifacts(raw_jsonl: str) -> TurnArtifacts:
             continue
 
         for block in content:
-            if not isinstance(block, dict):
+            block_type = block.get("type") if isinstance(block, dict) else None
+            # str check first: a malformed, unhashable "type" would raise on lookup
+            if not isinstance(block_type, str) or block_type not in _TOOL_BLOCK_TYPES:
                 continue
+            (_process_tool_use if block_type == "tool_use" else _process_tool_result)(block, result)
 
-            block_type = block.get("type", "")
+    return result
 
-            if block_type == "tool_use":
-                _process_tool_use(block, result)
-            elif block_type == "tool_result":
-                _process_tool_result(block, result)
 
-    return result
+@lru_cache(maxsize=32)
+def _tool_meta(tool_name: str) -> Mapping[str, Any]:
+    """Shared, read-only {"tool": name} metadata for artifacts that need nothing else."""
+    return MappingProxyType({"tool": tool_name})
+
+
+def _handle_read(tool_name: str, tool_input: dict, result: TurnArtifacts) -> None:
+    path = tool_input.get("file_path", "")
+    if path:
+        result.files_read.append(path)
+        result.artifacts.append(Artifact(
+            artifact_type="file_read",
+            artifact_value=path,
+            artifact_metadata=_tool_meta(tool_name),
+        ))
+
+
+def _handle_glob_grep(tool_name: str, tool_input: dict, result: TurnArtifacts) -> None:
+    pattern = tool_input.get("pattern", "")
+    path = tool_input.get("path", "")
+    result.artifacts.append(Artifact(
+        artifact_type="file_read",
+        artifact_value=pattern or path,
+        artifact_metadata={"tool": tool_name, "pattern": pattern, "path": path},
+    ))
+
+
+def _handle_write(tool_name: str, tool_input: dict, result: TurnArtifacts) -> None:
+    path = tool_input.get("file_path", "")
+    if path:
+        result.files_written.append(path)
+        result.artifacts.append(Artifact(
+            artifact_type="file_write",
+            artifact_value=path,
+            artifact_metadata=_tool_meta(tool_name),
+        ))
+
+
+def _handle_edit(tool_name: str, tool_input: dict, result: TurnArtifacts) -> None:
+    path = tool_input.get("file_path", "") or tool_input.get("notebook_path", "")
+    if path:
+        result.files_edited.append(path)
+        result.artifacts.append(Artifact(
+            artifact_type="file_edit",
+            artifact_value=path,
+            artifact_metadata={
+                "tool": tool_name,
+                "old_string": (tool_input.get("old_string", "") or "")[:100],
+            },
+        ))
+
+
+def _handle_bash(tool_name: str, tool_input: dict, result: TurnArtifacts) -> None:
+    command = tool_input.get("command", "")
+    if command:
+        result.commands_run.append(command)
+        result.artifacts.append(Artifact(
+            artifact_type="command",
+            artifact_value=command[:500],
+            artifact_metadata=_tool_meta(tool_name),
+        ))
+
+
+def _handle_task(tool_name: str, tool_input: dict, result: TurnArtifacts) -> None:
+    prompt = tool_input.get("prompt", "")[:200]
+    result.artifacts.append(Artifact(
+        artifact_type="tool_call",
+        artifact_value=f"Task: {prompt}",
+        artifact_metadata={"tool": tool_name, "subagent_type": tool_input.get("subagent_type", "")},
+    ))
+
+
+def _handle_generic(tool_name: str, tool_input: dict, result: TurnArtifacts) -> None:
+    result.artifacts.append(Artifact(
+        artifact_type="tool_call",
+        artifact_value=tool_name,
+        artifact_metadata={"tool": tool_name, "input_keys": list(tool_input.keys())[:10]},
+    ))
+
+
+# Tool name to artifact handler; anything else is recorded as a generic tool call
+_TOOL_HANDLERS: dict[str, Callable[[str, dict, TurnArtifacts], None]] = {
+    "Read": _handle_read,
+    "Glob": _handle_glob_grep,
+    "Grep": _handle_glob_grep,
+    "Write": _handle_write,
+    "Edit": _handle_edit,
+    "NotebookEdit": _handle_edit,
+    "Bash": _handle_bash,
+    "Task": _handle_task,
+}
 
 
 def _process_tool_use(block: dict, result: TurnArtifacts) -> None:
@@ -120,75 +222,7 @@ def _process_tool_use(block: dict, result: TurnArtifacts) -> None:
         tool_input = {}
 
     result.tool_call_count += 1
-    artifact_type = _TOOL_TYPE_MAP.get(tool_name, "tool_call")
-
-    if tool_name == "Read":
-        path = tool_input.get("file_path", "")
-        if path:
-            result.files_read.append(path)
-            result.artifacts.append(Artifact(
-                artifact_type="file_read",
-                artifact_value=path,
-                artifact_metadata={"tool": tool_name},
-            ))
-
-    elif tool_name in ("Glob", "Grep"):
-        pattern = tool_input.get("pattern", "")
-        path = tool_input.get("path", "")
-        result.artifacts.append(Artifact(
-            artifact_type="file_read",
-            artifact_value=pattern or path,
-            artifact_metadata={"tool": tool_name, "pattern": pattern, "path": path},
-        ))
-
-    elif tool_name == "Write":
-        path = tool_input.get("file_path", "")
-        if path:
-            result.files_written.append(path)
-            result.artifacts.append(Artifact(
-                artifact_type="file_write",
-                artifact_value=path,
-                artifact_metadata={"tool": tool_name},
-            ))
-
-    elif tool_name in ("Edit", "NotebookEdit"):
-        path = tool_input.get("file_path", "") or tool_input.get("notebook_path", "")
-        if path:
-            result.files_edited.append(path)
-            result.artifacts.append(Artifact(
-                artifact_type="file_edit",
-                artifact_value=path,
-                artifact_metadata={
-                    "tool": tool_name,
-                    "old_string": (tool_input.get("old_string", "") or "")[:100],
-                },
-            ))
-
-    elif tool_name == "Bash":
-        command = tool_input.get("command", "")
-        if command:
-            result.commands_run.append(command)
-            result.artifacts.append(Artifact(
-                artifact_type="command",
-                artifact_value=command[:500],
-                artifact_metadata={"tool": tool_name},
-            ))
-
-    elif tool_name == "Task":
-        prompt = tool_input.get("prompt", "")[:200]
-        result.artifacts.append(Artifact(
-            artifact_type="tool_call",
-            artifact_value=f"Task: {prompt}",
-            artifact_metadata={"tool": tool_name, "subagent_type": tool_input.get("subagent_type", "")},
-        ))
-
-    else:
-        # Generic tool call
-        result.artifacts.append(Artifact(
-            artifact_type="tool_call",
-            artifact_value=tool_name,
-            artifact_metadata={"tool": tool_name, "input_keys": list(tool_input.keys())[:10]},
-        ))
+    _TOOL_HANDLERS.get(tool_name, _handle_generic)(tool_name, tool_input, result)
 
 
 def _process_tool_result(block: dict, result: TurnArtifacts) -> None:
@@ -203,7 +237,15 @@ def _process_tool_result(block: dict, result: TurnArtifacts) -> None:
         return
 
     content = block.get("content", "")
-    if isinstance(content, list):
+    if (
+        isinstance(content, list)
+        and len(content) == 1
+        and isinstance(content[0], dict)
+        and content[0].get("type") == "text"
+    ):
+        # Common case: a single text block, no need to build and join a list
+        content = content[0].get("text", "")
+    elif isinstance(content, list):
         text_parts = [
             b.get("text", "") for b in content
             if isinstance(b, dict) and b.get("type") == "text"
@@ -234,19 +276,12 @@ def extract_file_paths_from_text(text: str) -> list[str]:
     if not text:
         return []
 
-    # Match absolute paths and relative paths with extensions
-    patterns = [
-        r'(?<!\w)(/[\w./-]+\.\w+)',  # /absolute/path/file.ext
-        r'(?<!\w)((?:src|tests|lib|app|pkg)/[\w./-]+\.\w+)',  # src/relative/path.ext
-    ]
-
     paths = []
     seen = set()
-    for pattern in patterns:
-        for match in re.findall(pattern, text):
-            path = match.strip()
-            if path not in seen and len(path) > 3:
-                seen.add(path)
-                paths.append(path)
+    for match in _FILE_PATH_RE.findall(text):
+        path = match.strip()
+        if path not in seen and len(path) > 3:
+            seen.add(path)
+            paths.append(path)
 
     return paths
@@ -3,39 +3,47 @@
 No LLM calls — must complete classification in <500ms total.
 """
 
+import functools
 import logging
 import re
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from simon.context.artifact_extractor import extract_file_paths_from_text
+from simon.context.project_state import get_active_project
 from simon.storage.models import Person, Project
 
+try:
+    import ahocorasick
+except ImportError:  # optional speedup, see the "speedups" extra
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
-# Query type detection patterns
-_CODE_PATTERNS = re.compile(
-    r'\b(bug|fix|error|refactor|test|function|class|module|import|file|code|implement|build|compile|lint|deploy)\b',
-    re.IGNORECASE,
-)
-_EMAIL_PATTERNS = re.compile(
-    r'\b(email|reply|send|draft|inbox|gmail|message|forward)\b',
-    re.IGNORECASE,
-)
-_TASK_PATTERNS = re.compile(
-    r'\b(task|todo|priority|deadline|sprint|kanban|backlog|assign|commit|milestone)\b',
-    re.IGNORECASE,
-)
-_META_PATTERNS = re.compile(
-    r'\b(focus|vault|sync|config|setup|hook|daemon|worker)\b',
-    re.IGNORECASE,
+# Query type detection: one alternation, one named group per type. A prompt
+# can mention several types, so _detect_query_type picks by priority. The
+# keywords are all ASCII, so ASCII \b checks are enough and cheaper. It runs
+# on the already-lowercased prompt, so no IGNORECASE is needed.
+_QUERY_TYPE_RE = re.compile(
+    r'\b(?:'
+    r'(?P<code>bug|fix|error|refactor|test|function|class|module|import|file|code|implement|build|compile|lint|deploy)'
+    r'|(?P<email>email|reply|send|draft|inbox|gmail|message|forward)'
+    r'|(?P<task>task|todo|priority|deadline|sprint|kanban|backlog|assign|commit|milestone)'
+    r'|(?P<meta>focus|vault|sync|config|setup|hook|daemon|worker)'
+    r')\b',
+    re.ASCII,
 )
+_QUERY_TYPE_PRIORITY = ("code", "email", "task", "meta")
+
+# Runs of word characters, i.e. the tokens \b delimits
+_WORD_RE = re.compile(r'\w+')
 
 
-@dataclass
+@dataclass(slots=True)
 class PromptClassification:
     """Result of classifying a user prompt for context retrieval."""
 
@@ -58,6 +66,10 @@ class PromptClassifier:
     def __init__(self) -> None:
         self._projects: list[tuple[str, str]] = []  # (slug, name)
         self._people: list[tuple[str, Optional[str]]] = []  # (name, email)
+        # Finds every entity mentioned in a lowercased prompt; see build_key_matcher
+        self._match_entities: Callable[[str], set[tuple[str, str]]] = no_matches
+        # Shortest entity key; shorter prompts can't mention any entity
+        self._min_key_len = 0
         self._loaded = False
 
     async def load_entities(self, session: AsyncSession) -> None:
@@ -78,12 +90,21 @@ class PromptClassifier:
         )
         self._people = [(row[0], row[1]) for row in result.all() if row[0]]
 
+        self._build_matchers()
+
         self._loaded = True
         logger.debug(
             "Classifier loaded %d projects, %d people",
             len(self._projects), len(self._people),
         )
 
+    def _build_matchers(self) -> None:
+        """Precompile entity matching for the loaded projects and people."""
+        entities_by_key = _entity_keys(self._projects, self._people)
+        self._min_key_len = min(map(len, entities_by_key), default=0)
+
+        self._match_entities = build_key_matcher(entities_by_key)
+
     def classify(
         self,
         prompt: str,
@@ -108,8 +129,6 @@ class PromptClassifier:
         prompt_lower = prompt.lower()
 
         # 0. Explicit project from project state
-        from simon.context.project_state import get_active_project
-
         explicit = get_active_project(workspace=cwd)
         if explicit:
             result.explicit_project = explicit
@@ -125,27 +144,32 @@ class PromptClassifier:
                 if slug == dir_name:
                     break
 
-        # 2. Project matching
-        for slug, name in self._projects:
-            if _word_match(slug, prompt_lower):
-                if slug not in result.project_slugs:
-                    result.project_slugs.append(slug)
-            elif name and _word_match(name.lower(), prompt_lower):
-                if slug not in result.project_slugs:
+        # 2./3. Project and person matching; the sets keep dedupe O(1)
+        # while the result lists preserve match order
+        seen_projects = set(result.project_slugs)
+        seen_people: set[str] = set()
+
+        # _min_key_len is 0 only when there are no entities at all
+        if self._min_key_len and len(prompt_lower) >= self._min_key_len:
+            matched = self._match_entities(prompt_lower)
+        else:
+            matched = set()
+
+        if matched:
+            for slug, name in self._projects:
+                if ("project", slug) in matched and slug not in seen_projects:
+                    seen_projects.add(slug)
                     result.project_slugs.append(slug)
 
-        # 3. Person matching
-        for name, email in self._people:
-            if len(name) > 2 and _word_match(name.lower(), prompt_lower):
-                if name not in result.person_names:
+            for name, email in self._people:
+                if ("person", name) in matched and name not in seen_people:
+                    seen_people.add(name)
                     result.person_names.append(name)
 
         # 4. Query type detection
-        result.query_type = _detect_query_type(prompt)
+        result.query_type = _detect_query_type(prompt_lower)
 
         # 5. File path extraction
-        from simon.context.artifact_extractor import extract_file_paths_from_text
-
         result.file_paths = extract_file_paths_from_text(prompt)
 
         # 6. Confidence scoring
@@ -154,48 +178,224 @@ class PromptClassifier:
         return result
 
 
-def _word_match(pattern: str, text: str) -> bool:
-    """Check if pattern appears as a word boundary match in text.
+@functools.lru_cache(maxsize=4096)
+def _word_pattern(pattern: str) -> re.Pattern:
+    """Compile the word-boundary regex for a lowercase entity key.
 
     Uses word boundaries when the pattern starts/ends with word chars,
-    falls back to substring search for patterns with special chars.
+    falls back to a plain literal for edges with special chars.
 
     Args:
         pattern: The pattern to search for (lowercase).
+
+    Returns:
+        Compiled pattern.
+    """
+    prefix = r'\b' if pattern and pattern[0].isalnum() else ''
+    suffix = r'\b' if pattern and pattern[-1].isalnum() else ''
+    return re.compile(prefix + re.escape(pattern) + suffix)
+
+
+def _word_find(pattern: str, text: str) -> bool:
+    """Word-boundary match for a purely alphanumeric pattern without regex.
+
+    str.find locates each occurrence; the neighbouring characters are then
+    checked the same way \\b would.
+
+    Args:
+        pattern: Alphanumeric pattern to search for (lowercase).
         text: The text to search in (lowercase).
 
     Returns:
         True if pattern matches at word boundaries.
     """
-    escaped = re.escape(pattern)
+    n = len(pattern)
+    i = text.find(pattern)
+    while i != -1:
+        end = i + n
+        if (i == 0 or not _is_word_char(text[i - 1])) and (
+            end == len(text) or not _is_word_char(text[end])
+        ):
+            return True
+        i = text.find(pattern, i + 1)
+    return False
 
-    # Use word boundaries only if pattern starts/ends with word chars
-    prefix = r'\b' if pattern and pattern[0].isalnum() else ''
-    suffix = r'\b' if pattern and pattern[-1].isalnum() else ''
 
-    try:
-        return bool(re.search(prefix + escaped + suffix, text))
-    except re.error:
-        return pattern in text
+_Matcher = Callable[[str], object]
+
+
+def _word_matcher(pattern: str) -> _Matcher:
+    """Build a word-boundary matcher for pattern, truthy on a match.
+
+    Purely alphanumeric patterns (the common case for slugs and names)
+    use the str.find path; anything else uses the compiled regex.
+
+    Args:
+        pattern: The pattern to search for (lowercase).
+
+    Returns:
+        Callable taking the text to search.
+    """
+    if pattern.isalnum():
+        return functools.partial(_word_find, pattern)
+    return _word_pattern(pattern).search
+
+
+def _entity_keys(
+    projects: list[tuple[str, str]],
+    people: list[tuple[str, Optional[str]]],
+) -> dict[str, tuple[tuple[str, str], ...]]:
+    """Map every matchable key to the entities it identifies.
+
+    Keys are project slugs, lowercased project names, and lowercased
+    person names longer than 2 characters.
+
+    Args:
+        projects: (slug, name) pairs.
+        people: (name, email) pairs.
+
+    Returns:
+        Dict of key -> ("project", slug) / ("person", name) tuples.
+    """
+    entities_by_key: dict[str, list[tuple[str, str]]] = {}
+    for slug, name in projects:
+        if slug:
+            entities_by_key.setdefault(slug, []).append(("project", slug))
+        if name:
+            entities_by_key.setdefault(name.lower(), []).append(("project", slug))
+    for name, email in people:
+        if len(name) > 2:
+            entities_by_key.setdefault(name.lower(), []).append(("person", name))
+    return {key: tuple(entities) for key, entities in entities_by_key.items()}
+
+
+def no_matches(text: str) -> set:
+    """Matcher used before any entities are loaded."""
+    return set()
+
+
+def build_key_matcher(entities_by_key: dict[str, tuple]) -> Callable[[str], set]:
+    """Build a matcher for a key -> entities mapping.
+
+    The returned callable takes lowercase text and returns the union of
+    the entities of every key found in it at word boundaries (as judged
+    by _word_matcher). With pyahocorasick installed that is one automaton
+    pass; otherwise single-word keys are looked up by text token and the
+    rest keep a per-key word-boundary matcher. The context worker uses it
+    for entity extraction too.
+
+    Args:
+        entities_by_key: Dict of lowercase key -> tuple of hashable entities.
+
+    Returns:
+        Callable taking the text to search.
+    """
+    if ahocorasick is not None:
+        return functools.partial(_automaton_matches, _build_automaton(entities_by_key))
+
+    # An alphanumeric key matches at word boundaries exactly when it
+    # equals a whole \w+ run of the text, so one set lookup per token
+    # replaces scanning the text once per key
+    token_index: dict[str, tuple] = {}
+    key_matchers: list[tuple[_Matcher, tuple]] = []
+    for key, entities in entities_by_key.items():
+        if key.isalnum():
+            token_index[key] = entities
+        else:
+            key_matchers.append((_word_matcher(key), entities))
+    return functools.partial(_fallback_matches, token_index, key_matchers)
+
+
+def _fallback_matches(
+    token_index: dict[str, tuple],
+    key_matchers: list[tuple[_Matcher, tuple]],
+    text: str,
+) -> set:
+    """Match text against the pure-Python structures from build_key_matcher.
+
+    Args:
+        token_index: Alphanumeric key -> entities.
+        key_matchers: (word-boundary matcher, entities) for the other keys.
+        text: The text to search in (lowercase).
+
+    Returns:
+        Set of matched entities.
+    """
+    matched = set()
+    for token in set(_WORD_RE.findall(text)):
+        entities = token_index.get(token)
+        if entities:
+            matched.update(entities)
+    for key_match, entities in key_matchers:
+        if key_match(text):
+            matched.update(entities)
+    return matched
+
+
+def _build_automaton(entities_by_key: dict[str, tuple]):
+    """Build one Aho-Corasick automaton over every entity key.
+
+    Each key maps to (length, check_start, check_end, entities), where
+    the check flags mirror _word_matcher's rule of only enforcing a word
+    boundary at an alphanumeric edge.
+
+    Args:
+        entities_by_key: Dict of lowercase key -> entities.
+
+    Returns:
+        A finalized ahocorasick.Automaton.
+    """
+    automaton = ahocorasick.Automaton()
+    for key, entities in entities_by_key.items():
+        automaton.add_word(key, (len(key), key[0].isalnum(), key[-1].isalnum(), entities))
+    automaton.make_automaton()
+    return automaton
+
+
+def _is_word_char(char: str) -> bool:
+    """Match the regex definition of \\w used by _word_matcher's \\b."""
+    return char.isalnum() or char == "_"
+
+
+def _automaton_matches(automaton, text: str) -> set:
+    """Find every entity whose key occurs in text at word boundaries.
+
+    Args:
+        automaton: Automaton from _build_automaton.
+        text: The text to search in (lowercase).
+
+    Returns:
+        Set of matched entities.
+    """
+    matched = set()
+    for end, (length, check_start, check_end, entities) in automaton.iter(text):
+        start = end - length + 1
+        if check_start and start > 0 and _is_word_char(text[start - 1]):
+            continue
+        if check_end and end + 1 < len(text) and _is_word_char(text[end + 1]):
+            continue
+        matched.update(entities)
+    return matched
 
 
 def _detect_query_type(prompt: str) -> str:
     """Detect the type of query from the prompt text.
 
     Args:
-        prompt: The user's prompt.
+        prompt: The user's prompt, lowercased.
 
     Returns:
         One of: "code", "email", "task", "meta", "general".
     """
-    if _CODE_PATTERNS.search(prompt):
-        return "code"
-    if _EMAIL_PATTERNS.search(prompt):
-        return "email"
-    if _TASK_PATTERNS.search(prompt):
-        return "task"
-    if _META_PATTERNS.search(prompt):
-        return "meta"
+    found = set()
+    for match in _QUERY_TYPE_RE.finditer(prompt):
+        if match.lastgroup == "code":
+            return "code"
+        found.add(match.lastgroup)
+
+    for query_type in _QUERY_TYPE_PRIORITY:
+        if query_type in found:
+            return query_type
     return "general"
 
 
@@ -1,6 +1,9 @@
 """Token-budget-aware context formatter for additionalContext injection."""
 
+import heapq
 import logging
+from operator import attrgetter
+from types import MappingProxyType
 from typing import Optional
 
 from simon.context.retriever import ContextBlock
@@ -8,7 +11,7 @@ from simon.context.retriever import ContextBlock
 logger = logging.getLogger(__name__)
 
 # Prefixes for each source type
-_TYPE_LABELS = {
+_TYPE_LABELS = MappingProxyType({
     "conversation": "Conv",
     "task": "Task",
     "email": "Email",
@@ -18,7 +21,16 @@ _TYPE_LABELS = {
     "file_context": "File",
     "error": "Error",
     "skill": "Skill",
-}
+})
+
+# Labels resolved so far, including titled fallbacks for unknown types
+_label_cache: dict[str, str] = dict(_TYPE_LABELS)
+
+# Lower bound on tokens per block used to size the partial sort; blocks
+# are rarely shorter, so the top (budget / this) blocks usually suffice
+_MIN_BLOCK_TOKENS_GUESS = 30
+
+_by_relevance = attrgetter("relevance_score")
 
 
 def format_context_blocks(
@@ -27,7 +39,7 @@ def format_context_blocks(
 ) -> str:
     """Format context blocks into a concise text block for additionalContext.
 
-    Sorts by relevance, greedily fills the token budget, and adds
+    Ranks by relevance, greedily fills the token budget, and adds
     an overflow note if blocks remain.
 
     Args:
@@ -40,27 +52,42 @@ def format_context_blocks(
     if not blocks:
         return ""
 
-    # Sort by relevance (highest first)
-    sorted_blocks = sorted(blocks, key=lambda b: b.relevance_score, reverse=True)
-
     header = "## Focus Context\n\n"
     header_tokens = _estimate_tokens(header)
     remaining = max_tokens - header_tokens
 
     formatted_parts = []
-    included = 0
+    included_ids = set()
     overflow = 0
 
-    for block in sorted_blocks:
-        formatted = _format_single_block(block)
-        tokens = _estimate_tokens(formatted)
-
-        if tokens <= remaining:
-            formatted_parts.append(formatted)
-            remaining -= tokens
-            included += 1
+    def _fill(ranked_blocks: list[ContextBlock]) -> None:
+        nonlocal remaining, overflow
+        for block in ranked_blocks:
+            tokens = _block_tokens(block)
+
+            if tokens <= remaining:
+                formatted_parts.append(_format_single_block(block))
+                included_ids.add(id(block))
+                remaining -= tokens
+            else:
+                overflow += 1
+
+    # Partial sort: only the top k can plausibly fit the budget.
+    # nlargest matches sorted(..., reverse=True)[:k], ties included.
+    k = min(len(blocks), max(16, max_tokens // _MIN_BLOCK_TOKENS_GUESS))
+    _fill(heapq.nlargest(k, blocks, key=_by_relevance))
+
+    if len(blocks) > k:
+        # Lower-ranked blocks may still fit the leftover budget; pay for
+        # the full sort only when one of them actually could
+        if remaining > 0 and any(
+            id(b) not in included_ids
+            and _block_tokens(b) <= remaining
+            for b in blocks
+        ):
+            _fill(sorted(blocks, key=_by_relevance, reverse=True)[k:])
         else:
-            overflow += 1
+            overflow += len(blocks) - k
 
     if not formatted_parts:
         return ""
@@ -82,8 +109,30 @@ def _format_single_block(block: ContextBlock) -> str:
     Returns:
         Formatted string.
     """
-    label = _TYPE_LABELS.get(block.source_type, block.source_type.title())
-    return f"[{label}] {block.content}"
+    return f"[{_block_label(block)}] {block.content}"
+
+
+def _block_label(block: ContextBlock) -> str:
+    """Get the display label for a block's source type."""
+    label = _label_cache.get(block.source_type)
+    if label is None:
+        label = _label_cache[block.source_type] = block.source_type.title()
+    return label
+
+
+def _block_tokens(block: ContextBlock) -> int:
+    """Estimate the tokens of a block's formatted line without building it.
+
+    Same result as _estimate_tokens(_format_single_block(block)): the
+    line is the label plus brackets and a space (3 chars) plus content.
+
+    Args:
+        block: The block to measure.
+
+    Returns:
+        Estimated token count (minimum 1).
+    """
+    return max(1, (len(_block_label(block)) + 3 + len(block.content)) // 4)
 
 
 def _estimate_tokens(text: str) -> int:
@@ -6,6 +6,7 @@ Used by classifier and worker to know which project context to load.
 
 import json
 import logging
+import os
 from pathlib import Path
 from typing import Optional
 
@@ -14,40 +15,82 @@ logger = logging.getLogger(__name__)
 STATE_FILE = Path.home() / ".config" / "simon" / "active_project.json"
 
 
+# Parsed state file, keyed by its (mtime_ns, size) when it was read
+_cache: Optional[tuple[tuple[int, int], dict]] = None
+
+
 def _read_state() -> dict:
     """Read the project state file.
 
+    The parsed file is cached in-process and only re-read when its mtime
+    or size changes. Callers get their own copy, so mutating the result
+    (as set/clear do before writing) never touches the cache.
+
     Returns:
         State dict with 'global' and 'workspaces' keys.
     """
-    if not STATE_FILE.exists():
-        return {"global": None, "workspaces": {}}
+    global _cache
+
     try:
-        data = json.loads(STATE_FILE.read_text())
-        if not isinstance(data, dict):
+        st = STATE_FILE.stat()
+    except FileNotFoundError:
+        return {"global": None, "workspaces": {}}
+    except OSError as e:
+        logger.warning("Failed to read project state: %s", e)
+        return {"global": None, "workspaces": {}}
+
+    key = (st.st_mtime_ns, st.st_size)
+    if _cache is None or _cache[0] != key:
+        try:
+            data = json.loads(STATE_FILE.read_bytes())
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning("Failed to read project state: %s", e)
             return {"global": None, "workspaces": {}}
+        if not isinstance(data, dict):
+            data = {}
         data.setdefault("global", None)
         data.setdefault("workspaces", {})
-        return data
-    except (json.JSONDecodeError, OSError) as e:
-        logger.warning("Failed to read project state: %s", e)
-        return {"global": None, "workspaces": {}}
+        _cache = (key, data)
+
+    data = dict(_cache[1])
+    if isinstance(data["workspaces"], dict):
+        data["workspaces"] = dict(data["workspaces"])
+    return data
 
 
 def _write_state(state: dict) -> None:
-    """Write the project state file atomically.
+    """Write the project state file atomically (temp file + fsync + replace).
+
+    The parent directory is only created when opening the temp file
+    fails because it's missing, so warm writes skip the mkdir.
 
     Args:
         state: State dict to write.
     """
-    STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    global _cache
+
+    # Machine-read file: the compact form stays on the C encoder fast path
+    data = json.dumps(state, separators=(",", ":")).encode()
     tmp = STATE_FILE.with_suffix(".tmp")
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
     try:
-        tmp.write_text(json.dumps(state, indent=2) + "\n")
-        tmp.rename(STATE_FILE)
+        try:
+            fd = os.open(tmp, flags, 0o644)
+        except FileNotFoundError:
+            STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(tmp, flags, 0o644)
+        try:
+            os.write(fd, data)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp, STATE_FILE)
     except Exception:
         tmp.unlink(missing_ok=True)
         raise
+    finally:
+        # Don't trust mtime granularity to catch our own rapid rewrites
+        _cache = None
 
 
 def get_active_project(workspace: Optional[str] = None) -> Optional[str]:
@@ -1,12 +1,15 @@
 """Session recording — stores Claude Code conversations in the database."""
 
 import logging
+import uuid
+from datetime import datetime
+from itertools import chain
 from pathlib import Path
 from typing import Optional
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from simon.ingestion.claude_code import _parse_timestamp, parse_session_into_turns
 from simon.storage.db import get_session
@@ -25,7 +28,8 @@ async def record_session(
     """Record a Claude Code session into the database.
 
     Parses the JSONL transcript into turns, upserts the session row,
-    and inserts turns + content. Deduplicates turns by content_hash.
+    and inserts turns + content. Turns already stored for the session are
+    skipped by the database via ON CONFLICT on (session_id, content_hash).
 
     Args:
         session: Database session.
@@ -41,15 +45,16 @@ async def record_session(
         logger.warning("Transcript not found: %s", transcript_path)
         return {"session_id": session_id, "turns_recorded": 0, "turns_skipped": 0, "error": "file_not_found"}
 
+    # Turns are streamed; peek at the first so empty transcripts don't
+    # create a session row
     turns = parse_session_into_turns(path)
-    if not turns:
+    first_turn = next(turns, None)
+    if first_turn is None:
         return {"session_id": session_id, "turns_recorded": 0, "turns_skipped": 0}
 
     # Get or create agent session
     result = await session.execute(
-        select(AgentSession)
-        .options(selectinload(AgentSession.turns))
-        .where(AgentSession.session_id == session_id)
+        select(AgentSession).where(AgentSession.session_id == session_id)
     )
     agent_session = result.scalar_one_or_none()
 
@@ -61,52 +66,57 @@ async def record_session(
         )
         session.add(agent_session)
         await session.flush()
-        existing_hashes = set()  # New session, no existing turns
-    else:
-        # Turns were eager-loaded via selectinload above
-        existing_hashes = {t.content_hash for t in agent_session.turns}
-
-    turns_recorded = 0
-    turns_skipped = 0
-
-    for turn_data in turns:
-        if turn_data["content_hash"] in existing_hashes:
-            turns_skipped += 1
-            continue
-
-        turn = AgentTurn(
-            session_id=agent_session.id,
-            turn_number=turn_data["turn_number"],
-            user_message=turn_data.get("user_message"),
-            content_hash=turn_data["content_hash"],
-            model_name=turn_data.get("model_name"),
-            tool_names=turn_data.get("tool_names"),
-            started_at=_parse_timestamp(turn_data.get("started_at")),
-            ended_at=_parse_timestamp(turn_data.get("ended_at")),
-        )
-        session.add(turn)
-        await session.flush()
-
-        content = AgentTurnContent(
-            turn_id=turn.id,
-            raw_jsonl=turn_data["raw_jsonl"],
-            assistant_text=turn_data.get("assistant_text"),
-            content_size=len(turn_data["raw_jsonl"]),
+    elif workspace_path and "/" in workspace_path and "/" not in (agent_session.workspace_path or ""):
+        # Replace a mangled project dir stored by an older `record --all`
+        agent_session.workspace_path = workspace_path
+
+    # Single pass over the transcript: build the insert rows and track the
+    # session's started/last-activity bounds. Content rows are keyed by
+    # hash so a hash repeated within the transcript gets one row.
+    turn_rows = []
+    content_rows: dict[str, dict] = {}
+    first_started: Optional[datetime] = None
+    last_started: Optional[datetime] = None
+
+    for turn_data in chain((first_turn,), turns):
+        started_at = _parse_timestamp(turn_data.get("started_at"))
+        if started_at is not None:
+            if first_started is None or started_at < first_started:
+                first_started = started_at
+            if last_started is None or started_at > last_started:
+                last_started = started_at
+
+        turn_rows.append(_turn_row(agent_session.id, turn_data, started_at))
+        content_rows.setdefault(turn_data["content_hash"], _content_row(turn_data))
+
+    # The unique (session_id, content_hash) index drops turns that are
+    # already stored, so RETURNING reports only the rows actually inserted
+    result = await session.execute(
+        pg_insert(AgentTurn)
+        .on_conflict_do_nothing(index_elements=["session_id", "content_hash"])
+        .returning(AgentTurn.id, AgentTurn.content_hash),
+        turn_rows,
+    )
+    turn_ids = {content_hash: turn_id for turn_id, content_hash in result}
+
+    turns_recorded = len(turn_ids)
+    turns_skipped = len(turn_rows) - turns_recorded
+
+    if turn_ids:
+        await session.execute(
+            insert(AgentTurnContent),
+            [
+                {"turn_id": turn_id, **content_rows[content_hash]}
+                for content_hash, turn_id in turn_ids.items()
+            ],
         )
-        session.add(content)
-        turns_recorded += 1
 
     # Update session metadata
-    all_timestamps = [
-        _parse_timestamp(t.get("started_at")) for t in turns
-    ]
-    valid_timestamps = [ts for ts in all_timestamps if ts is not None]
-
-    if valid_timestamps:
-        agent_session.started_at = agent_session.started_at or min(valid_timestamps)
-        agent_session.last_activity_at = max(valid_timestamps)
+    if first_started is not None:
+        agent_session.started_at = agent_session.started_at or first_started
+        agent_session.last_activity_at = last_started
 
-    agent_session.turn_count = len(existing_hashes) + turns_recorded
+    agent_session.turn_count = (agent_session.turn_count or 0) + turns_recorded
     agent_session.transcript_path = transcript_path
 
     await session.flush()
@@ -123,6 +133,48 @@ async def record_session(
     }
 
 
+def _turn_row(agent_session_id: uuid.UUID, turn_data: dict, started_at: Optional[datetime]) -> dict:
+    """Build the agent_turns insert parameters for one parsed turn.
+
+    Args:
+        agent_session_id: ID of the owning AgentSession.
+        turn_data: Turn dict from parse_session_into_turns.
+        started_at: The turn's already-parsed start timestamp.
+
+    Returns:
+        Column values keyed by AgentTurn attribute name.
+    """
+    return {
+        "session_id": agent_session_id,
+        "turn_number": turn_data["turn_number"],
+        "user_message": turn_data.get("user_message"),
+        "content_hash": turn_data["content_hash"],
+        "model_name": turn_data.get("model_name"),
+        "tool_names": turn_data.get("tool_names"),
+        "started_at": started_at,
+        "ended_at": _parse_timestamp(turn_data.get("ended_at")),
+    }
+
+
+def _content_row(turn_data: dict) -> dict:
+    """Build the agent_turn_content insert parameters for one parsed turn.
+
+    turn_id is filled in once the turn insert has returned the new IDs.
+
+    Args:
+        turn_data: Turn dict from parse_session_into_turns.
+
+    Returns:
+        Column values keyed by AgentTurnContent attribute name.
+    """
+    raw_jsonl = turn_data["raw_jsonl"]
+    return {
+        "raw_jsonl": raw_jsonl,
+        "assistant_text": turn_data.get("assistant_text"),
+        "content_size": len(raw_jsonl),
+    }
+
+
 async def enqueue_session_recording(
     session_id: str,
     transcript_path: str,
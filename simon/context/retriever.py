@@ -1,19 +1,28 @@
-"""Context retriever — queries PostgreSQL for relevant context based on classification."""
+"""Context retriever — queries PostgreSQL for relevant context based on classification.
 
+Source queries run concurrently, each on its own pooled connection, so the
+engine's pool must hold a retrieval's worth of connections (see
+storage.db.get_engine) or the queries queue behind each other.
+"""
+
+import asyncio
+import functools
 import logging
 import re
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from operator import attrgetter
 from pathlib import Path
-from typing import Optional
+from typing import Any, Awaitable, Callable, Iterable, Optional
 from uuid import UUID
 
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy import Row, Select, and_, func, literal, literal_column, or_, select, true, union_all
+from sqlalchemy.dialects.postgresql import array as pg_array
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import aliased, load_only, selectinload
 
 from simon.context.classifier import PromptClassification
-from simon.skills.installer import InstalledSkill, list_installed_skills, _parse_frontmatter
+from simon.skills.installer import InstalledSkill, list_installed_skills, _split_frontmatter
 from simon.storage.models import (
     AgentSession,
     AgentTurn,
@@ -29,8 +38,21 @@ from simon.storage.models import (
 
 logger = logging.getLogger(__name__)
 
+_by_relevance = attrgetter("relevance_score")
+
+# Characters Claude Code replaces with "-" when naming a project's
+# session directory after its cwd
+_MANGLE_RE = re.compile(r'[^a-zA-Z0-9]')
+
+# Word splitters for skill relevance matching
+_STEM_SPLIT_RE = re.compile(r"[_\-.]")
+_NAME_SPLIT_RE = re.compile(r"[_\-\s]+")
+_NAME_PARTS_SPLIT_RE = re.compile(r"[_\-]+")
+_DESCRIPTION_SPLIT_RE = re.compile(r"[\s,.\-_]+")
+_BODY_SPLIT_RE = re.compile(r"[\s,.\-_:;()]+")
 
-@dataclass
+
+@dataclass(slots=True)
 class ContextBlock:
     """A single block of context to inject."""
 
@@ -55,16 +77,24 @@ class ContextRetriever:
 
     async def retrieve(
         self,
-        session: AsyncSession,
+        session_factory: async_sessionmaker[AsyncSession],
         classification: PromptClassification,
         max_tokens: int = 1500,
     ) -> list[ContextBlock]:
         """Retrieve context blocks based on classification.
 
+        The per-source queries are independent, so they run concurrently.
+        An AsyncSession can't run concurrent queries, so each query opens
+        its own session from session_factory.
+
+        The token budget isn't applied here: format_context_blocks picks
+        the top blocks that fit with a partial sort and reports how many
+        were left out, which it can only do if it sees every block.
+
         Args:
-            session: Database session.
+            session_factory: Factory for the database sessions used by each query.
             classification: The prompt classification result.
-            max_tokens: Token budget for all context blocks combined.
+            max_tokens: Token budget the caller will format the blocks with.
 
         Returns:
             List of ContextBlocks sorted by relevance.
@@ -76,110 +106,131 @@ class ContextRetriever:
 
         # Resolve project IDs
         project_ids: list[UUID] = []
-        if classification.project_slugs:
-            result = await session.execute(
-                select(Project.id, Project.slug)
-                .where(Project.slug.in_(classification.project_slugs))
-            )
-            project_ids = [row[0] for row in result.all()]
-        elif classification.workspace_project:
-            result = await session.execute(
-                select(Project.id)
-                .where(Project.slug == classification.workspace_project)
-            )
-            row = result.first()
-            if row:
-                project_ids = [row[0]]
+        async with session_factory() as session:
+            if classification.project_slugs:
+                result = await session.execute(
+                    select(Project.id, Project.slug)
+                    .where(Project.slug.in_(classification.project_slugs))
+                )
+                project_ids = [row[0] for row in result.all()]
+            elif classification.workspace_project:
+                result = await session.execute(
+                    select(Project.id)
+                    .where(Project.slug == classification.workspace_project)
+                )
+                row = result.first()
+                if row:
+                    project_ids = [row[0]]
+
+        # One clock read for every relative time in this retrieval
+        now = datetime.now(timezone.utc)
+
+        def query(helper, *args, **kwargs) -> Awaitable[list[ContextBlock]]:
+            return _run_in_session(session_factory, helper, *args, **kwargs)
+
+        # Gather context from various sources. Queries are listed in the
+        # order their blocks should appear; gather keeps that order.
+        queries: list[Awaitable[list[ContextBlock]]] = []
 
-        # Gather context from various sources
         if project_ids:
-            for pid in project_ids:
-                blocks.extend(await self._get_recent_turns(session, project_id=pid))
-                blocks.extend(await self._get_active_tasks(session, project_id=pid))
-                blocks.extend(await self._get_open_commitments(session, project_id=pid))
+            queries.append(query(self._get_recent_turns, project_ids=project_ids, now=now))
+            queries.append(query(self._get_active_tasks, project_ids=project_ids))
+            queries.append(query(self._get_open_commitments, project_ids=project_ids))
 
         if classification.workspace_project:
             # Always try workspace matching — supplements project-matched turns
-            blocks.extend(await self._get_recent_turns(
-                session, workspace_path_like=classification.workspace_project
+            queries.append(query(
+                self._get_recent_turns, workspace_name=classification.workspace_project, now=now
             ))
 
         if not project_ids and not classification.workspace_project:
             # Global fallback: recent turns from any session
-            blocks.extend(await self._get_recent_turns(session, limit=3))
+            queries.append(query(self._get_recent_turns, limit=3, now=now))
 
         if classification.person_names:
-            blocks.extend(await self._get_person_context(session, classification.person_names))
+            queries.append(query(self._get_person_context, classification.person_names))
 
         # File-based context for code queries
         if classification.file_paths:
-            blocks.extend(await self._get_turns_by_file(session, classification.file_paths))
+            queries.append(query(self._get_turns_by_file, classification.file_paths))
 
         # Recent errors for debugging context
         if classification.query_type == "code" and project_ids:
-            for pid in project_ids:
-                blocks.extend(await self._get_recent_errors(session, project_id=pid))
+            queries.append(query(self._get_recent_errors, project_ids=project_ids, now=now))
 
         # Always include open commitments and active sprints
         if not project_ids:
-            blocks.extend(await self._get_open_commitments(session))
-        blocks.extend(await self._get_active_sprints(session))
+            queries.append(query(self._get_open_commitments))
+        queries.append(query(self._get_active_sprints, now=now))
+
+        # Skill matching — disk I/O, no DB needed. It runs in a worker
+        # thread so a slow disk doesn't stall the loop, overlapping the
+        # database queries.
+        queries.append(asyncio.to_thread(self._get_relevant_skills, classification))
 
-        # Skill matching — disk I/O, no DB needed
-        blocks.extend(self._get_relevant_skills(classification))
+        for query_blocks in await asyncio.gather(*queries):
+            blocks.extend(query_blocks)
 
-        # Deduplicate by source_id
-        seen = set()
-        unique_blocks = []
-        for block in blocks:
-            if block.source_id not in seen:
-                seen.add(block.source_id)
-                unique_blocks.append(block)
+        # Deduplicate by source_id in one pass, keeping first positions.
+        # Repeats are the same row found by two queries (e.g. a turn
+        # matched by both project and workspace), so which copy is kept
+        # doesn't matter.
+        unique_blocks = list({block.source_id: block for block in blocks}.values())
 
-        # Sort by relevance
-        unique_blocks.sort(key=lambda b: b.relevance_score, reverse=True)
+        # Sort by relevance. The formatter picks the top blocks for the
+        # token budget itself, but callers also list every block.
+        unique_blocks.sort(key=_by_relevance, reverse=True)
 
         return unique_blocks
 
     async def _get_recent_turns(
         self,
         session: AsyncSession,
-        project_id: Optional[UUID] = None,
-        workspace_path_like: Optional[str] = None,
+        project_ids: Optional[list[UUID]] = None,
+        workspace_name: Optional[str] = None,
         limit: int = 5,
+        now: Optional[datetime] = None,
     ) -> list[ContextBlock]:
         """Query recent agent turn summaries.
 
         Args:
             session: Database session.
-            project_id: Filter by project.
-            workspace_path_like: Filter by workspace path pattern.
+            project_ids: Filter by projects; limit then applies per project.
+            workspace_name: Filter by lowercased workspace directory name.
             limit: Max results.
+            now: Reference time for relative ages; defaults to the current time.
 
         Returns:
             List of ContextBlocks.
         """
-        query = (
-            select(AgentTurn)
-            .join(AgentSession)
-            .options(selectinload(AgentTurn.session))
-            .order_by(AgentTurn.started_at.desc().nulls_last())
-            .limit(limit)
-        )
+        order_by = AgentTurn.started_at.desc().nulls_last()
 
-        if project_id:
-            query = query.where(AgentSession.project_id == project_id)
-        elif workspace_path_like:
-            query = query.where(AgentSession.workspace_path.ilike(f"%{workspace_path_like}%"))
+        if project_ids:
+            turn, query = _top_per_project(
+                select(AgentTurn).join(AgentSession),
+                AgentTurn, AgentSession.project_id, order_by, project_ids, limit,
+            )
+            result = await session.execute(query.options(_turn_block_columns(turn)))
+            turns = _in_project_order(result, project_ids)
+        else:
+            query = (
+                select(AgentTurn)
+                .join(AgentSession)
+                .options(_turn_block_columns(AgentTurn))
+                .order_by(order_by)
+                .limit(limit)
+            )
+            if workspace_name:
+                query = query.where(_workspace_filter(workspace_name))
 
-        result = await session.execute(query)
-        turns = result.scalars().all()
+            result = await session.execute(query)
+            turns = result.scalars()
 
         blocks = []
         for turn in turns:
             title = turn.turn_title or (turn.user_message or "")[:60]
             content = turn.assistant_summary or (turn.user_message or "")[:150]
-            age = _relative_time(turn.started_at)
+            age = _relative_time(turn.started_at, now)
 
             blocks.append(ContextBlock(
                 source_type="conversation",
@@ -195,29 +246,27 @@ class ContextRetriever:
     async def _get_active_tasks(
         self,
         session: AsyncSession,
-        project_id: UUID,
+        project_ids: list[UUID],
         limit: int = 5,
     ) -> list[ContextBlock]:
-        """Query active tasks for a project.
+        """Query active tasks for a set of projects.
 
         Args:
             session: Database session.
-            project_id: The project to query.
-            limit: Max results.
+            project_ids: The projects to query.
+            limit: Max results per project.
 
         Returns:
             List of ContextBlocks.
         """
-        result = await session.execute(
-            select(Task)
-            .where(
-                Task.project_id == project_id,
-                Task.status.in_(["in_progress", "waiting", "backlog"]),
-            )
-            .order_by(Task.status, Task.priority)
-            .limit(limit)
+        task, query = _top_per_project(
+            select(Task).where(Task.status.in_(["in_progress", "waiting", "backlog"])),
+            Task, Task.project_id, [Task.status, Task.priority], project_ids, limit,
         )
-        tasks = result.scalars().all()
+        result = await session.execute(query.options(
+            load_only(task.id, task.title, task.status, task.priority, task.due_date)
+        ))
+        tasks = _in_project_order(result, project_ids)
 
         blocks = []
         for task in tasks:
@@ -237,7 +286,7 @@ class ContextRetriever:
     async def _get_open_commitments(
         self,
         session: AsyncSession,
-        project_id: Optional[UUID] = None,
+        project_ids: Optional[list[UUID]] = None,
         person_name: Optional[str] = None,
         limit: int = 3,
     ) -> list[ContextBlock]:
@@ -245,26 +294,27 @@ class ContextRetriever:
 
         Args:
             session: Database session.
-            project_id: Filter by project.
+            project_ids: Filter by projects; limit then applies per project.
             person_name: Filter by person name (unused for now, ID-based).
             limit: Max results.
 
         Returns:
             List of ContextBlocks.
         """
-        query = (
-            select(Commitment)
-            .options(selectinload(Commitment.person))
-            .where(Commitment.status == "open")
-            .order_by(Commitment.deadline.asc().nulls_last())
-            .limit(limit)
-        )
-
-        if project_id:
-            query = query.where(Commitment.project_id == project_id)
+        order_by = Commitment.deadline.asc().nulls_last()
+        query = select(Commitment).where(Commitment.status == "open")
 
-        result = await session.execute(query)
-        commitments = result.scalars().all()
+        if project_ids:
+            commitment, query = _top_per_project(
+                query, Commitment, Commitment.project_id, order_by, project_ids, limit,
+            )
+            result = await session.execute(query.options(selectinload(commitment.person)))
+            commitments = _in_project_order(result, project_ids)
+        else:
+            result = await session.execute(
+                query.options(selectinload(Commitment.person)).order_by(order_by).limit(limit)
+            )
+            commitments = result.scalars()
 
         blocks = []
         for c in commitments:
@@ -299,15 +349,25 @@ class ContextRetriever:
         Returns:
             List of ContextBlocks.
         """
-        blocks = []
-        for name in person_names[:3]:
-            result = await session.execute(
-                select(Person).where(Person.name.ilike(f"%{name}%")).limit(1)
-            )
-            person = result.scalar_one_or_none()
-            if not person:
-                continue
+        if not person_names:
+            return []
 
+        # First match per name, all names in one round-trip; position
+        # keeps the names' order
+        matches = union_all(*(
+            select(Person.id.label("person_id"), literal(position).label("position"))
+            .where(Person.name.ilike(f"%{name}%"))
+            .limit(1)
+            for position, name in enumerate(person_names[:3])
+        )).subquery()
+        result = await session.execute(
+            select(Person)
+            .join(matches, Person.id == matches.c.person_id)
+            .order_by(matches.c.position)
+        )
+
+        blocks = []
+        for person in result.scalars():
             parts = [person.name]
             if person.organization:
                 parts.append(f"({person.organization})")
@@ -340,74 +400,106 @@ class ContextRetriever:
         Returns:
             List of ContextBlocks for turns that touched those files.
         """
-        from sqlalchemy import any_
-
-        blocks = []
-        for path in file_paths[:5]:
-            result = await session.execute(
-                select(AgentTurn)
-                .join(AgentTurnContent, AgentTurn.id == AgentTurnContent.turn_id)
-                .where(AgentTurnContent.files_touched.any(path))
-                .order_by(AgentTurn.started_at.desc().nulls_last())
-                .limit(limit)
+        paths = file_paths[:5]
+
+        # One query for all paths: unnest each candidate turn's files,
+        # keep the requested ones and rank turns per path by recency
+        touched = func.unnest(AgentTurnContent.files_touched).table_valued("path").render_derived()
+        ranked = (
+            select(
+                AgentTurn.id.label("turn_id"),
+                touched.c.path,
+                func.row_number().over(
+                    partition_by=touched.c.path,
+                    order_by=AgentTurn.started_at.desc().nulls_last(),
+                ).label("rn"),
             )
-            turns = result.scalars().all()
+            .join(AgentTurnContent, AgentTurn.id == AgentTurnContent.turn_id)
+            .join(touched, true())
+            .where(
+                AgentTurnContent.files_touched.op("&&")(pg_array(paths)),
+                touched.c.path.in_(paths),
+            )
+            .subquery()
+        )
+        result = await session.execute(
+            select(AgentTurn, ranked.c.path)
+            .join(ranked, AgentTurn.id == ranked.c.turn_id)
+            .options(_turn_block_columns(AgentTurn))
+            .where(ranked.c.rn <= limit)
+            .order_by(ranked.c.rn)
+        )
+
+        # Same order as querying each path in turn
+        position = {path: i for i, path in enumerate(paths)}
+        rows = sorted(result, key=lambda row: position[row[1]])
 
-            for turn in turns:
-                title = turn.turn_title or (turn.user_message or "")[:60]
-                content = f"Previously touched {path}: {turn.assistant_summary or turn.user_message or ''}".strip()[:200]
+        blocks = []
+        for turn, path in rows:
+            # Strip the summary before slicing rather than the whole string after
+            summary = (turn.assistant_summary or turn.user_message or "").strip()
+            content = f"Previously touched {path}: {summary}"[:200] if summary else f"Previously touched {path}:"
 
-                blocks.append(ContextBlock(
-                    source_type="file_context",
-                    source_id=f"file:{turn.id}:{path}",
-                    title=f"File: {path.split('/')[-1]}",
-                    content=content,
-                    relevance_score=0.65,
-                    timestamp=turn.started_at,
-                ))
+            blocks.append(ContextBlock(
+                source_type="file_context",
+                source_id=f"file:{turn.id}:{path}",
+                title=f"File: {path.split('/')[-1]}",
+                content=content,
+                relevance_score=0.65,
+                timestamp=turn.started_at,
+            ))
 
         return blocks
 
     async def _get_recent_errors(
         self,
         session: AsyncSession,
-        project_id: Optional[UUID] = None,
+        project_ids: Optional[list[UUID]] = None,
         limit: int = 3,
+        now: Optional[datetime] = None,
     ) -> list[ContextBlock]:
         """Get recent errors from conversation turns.
 
         Args:
             session: Database session.
-            project_id: Filter by project.
+            project_ids: Filter by projects; limit then applies per project.
             limit: Max results.
+            now: Reference time for relative ages; defaults to the current time.
 
         Returns:
             List of ContextBlocks for recent errors.
         """
+        order_by = AgentTurn.started_at.desc().nulls_last()
         query = (
             select(AgentTurn)
             .join(AgentTurnContent, AgentTurn.id == AgentTurnContent.turn_id)
             .where(AgentTurnContent.errors_encountered.isnot(None))
-            .order_by(AgentTurn.started_at.desc().nulls_last())
-            .limit(limit)
         )
 
-        if project_id:
-            query = query.join(AgentSession).where(AgentSession.project_id == project_id)
-
-        result = await session.execute(query)
-        turns = result.scalars().all()
+        if project_ids:
+            turn, query = _top_per_project(
+                query.join(AgentSession),
+                AgentTurn, AgentSession.project_id, order_by, project_ids, limit,
+            )
+            result = await session.execute(query.options(_turn_block_columns(turn)))
+            turns = _in_project_order(result, project_ids)
+        else:
+            result = await session.execute(
+                query.options(_turn_block_columns(AgentTurn)).order_by(order_by).limit(limit)
+            )
+            turns = result.scalars()
 
         blocks = []
         for turn in turns:
             title = turn.turn_title or "Error encountered"
-            age = _relative_time(turn.started_at)
+            age = _relative_time(turn.started_at, now)
+            message = (turn.user_message or "").strip()
 
             blocks.append(ContextBlock(
                 source_type="error",
                 source_id=f"error:{turn.id}",
                 title=f"{title} ({age})",
-                content=f"Errors in previous session: {turn.user_message or ''}".strip()[:200],
+                content=f"Errors in previous session: {message}"[:200] if message else "Errors in previous session:",
                 relevance_score=0.55,
                 timestamp=turn.started_at,
             ))
@@ -417,23 +509,25 @@ class ContextRetriever:
     async def _get_active_sprints(
         self,
         session: AsyncSession,
+        now: Optional[datetime] = None,
     ) -> list[ContextBlock]:
         """Get active sprint info.
 
         Args:
             session: Database session.
+            now: Reference time for sprint ends; defaults to the current time.
 
         Returns:
             List of ContextBlocks for active sprints.
         """
-        now = datetime.now(timezone.utc)
+        now = now or datetime.now(timezone.utc)
         result = await session.execute(
             select(Sprint)
             .options(selectinload(Sprint.project))
             .where(Sprint.is_active.is_(True), Sprint.ends_at > now)
             .limit(3)
         )
-        sprints = result.scalars().all()
+        sprints = result.scalars()
 
         blocks = []
         for sprint in sprints:
@@ -469,16 +563,6 @@ class ContextRetriever:
         Returns:
             List of ContextBlocks for relevant skills.
         """
-        try:
-            cwd = Path(classification.workspace_project).resolve() if classification.workspace_project else None
-        except (TypeError, ValueError):
-            cwd = None
-
-        # Scan both personal and project-scoped skills
-        skills = list_installed_skills(scope="all", project_path=cwd)
-        if not skills:
-            return []
-
         # Build keyword set from prompt classification
         prompt_words = set()
         for slug in classification.project_slugs:
@@ -492,19 +576,36 @@ class ContextRetriever:
         for path in classification.file_paths:
             # Extract filename without extension
             stem = Path(path).stem.lower()
-            prompt_words.update(re.split(r"[_\-.]", stem))
+            prompt_words.update(_STEM_SPLIT_RE.split(stem))
 
         # Filter out very short/common words
-        prompt_words = {w for w in prompt_words if len(w) > 2}
+        prompt_words = frozenset(w for w in prompt_words if len(w) > 2)
 
+        # Nothing can match, so don't touch the skills directories at all
         if not prompt_words:
             return []
 
+        try:
+            cwd = Path(classification.workspace_project).resolve() if classification.workspace_project else None
+        except (TypeError, ValueError):
+            cwd = None
+
+        # Scan both personal and project-scoped skills
+        skills = list_installed_skills(scope="all", project_path=cwd)
+        if not skills:
+            return []
+
+        prompt_bloom = _bloom_filter(prompt_words)
+
         scored: list[tuple[float, InstalledSkill, str]] = []
         for skill in skills:
-            score, body = _score_skill_relevance(skill, prompt_words)
+            index = _skill_index(skill)
+            # No shared bit means no shared word, so skip the set work
+            if not index.bloom & prompt_bloom:
+                continue
+            score = _score_skill_relevance(index, prompt_words)
             if score > 0:
-                scored.append((score, skill, body))
+                scored.append((score, skill, index.body))
 
         # Sort by score descending, take top N
         scored.sort(key=lambda x: x[0], reverse=True)
@@ -524,87 +625,264 @@ class ContextRetriever:
         return blocks
 
 
-def _score_skill_relevance(
-    skill: InstalledSkill,
-    prompt_words: set[str],
-) -> tuple[float, str]:
-    """Score how relevant a skill is to the current prompt.
+def _turn_block_columns(turn: Any) -> Any:
+    """Load only the AgentTurn columns that turn-based ContextBlocks read.
+
+    Args:
+        turn: AgentTurn or an alias of it.
+
+    Returns:
+        A load_only loader option.
+    """
+    return load_only(
+        turn.id, turn.turn_title, turn.user_message, turn.assistant_summary, turn.started_at
+    )
+
+
+def _top_per_project(
+    query: Select,
+    entity: type,
+    project_col: Any,
+    order_by: Any,
+    project_ids: list[UUID],
+    limit: int,
+) -> tuple[Any, Select]:
+    """Limit a query to its first rows for each of several projects.
+
+    Ranks rows with ROW_NUMBER() over project_col in a subquery, so one
+    round-trip replaces a query per project.
+
+    Args:
+        query: Select of entity with joins and filters applied.
+        entity: ORM class selected by query.
+        project_col: Column holding the row's project ID.
+        order_by: Ordering within each project.
+        project_ids: Projects to include.
+        limit: Max rows per project.
+
+    Returns:
+        Tuple of (entity alias over the subquery, select returning
+        (entity, project ID) rows ordered by rank).
+    """
+    ranked = (
+        query.add_columns(
+            project_col.label("partition_id"),
+            func.row_number().over(partition_by=project_col, order_by=order_by).label("rn"),
+        )
+        .where(project_col.in_(project_ids))
+        .subquery()
+    )
+    row = aliased(entity, ranked)
+    return row, (
+        select(row, ranked.c.partition_id)
+        .where(ranked.c.rn <= limit)
+        .order_by(ranked.c.rn)
+    )
+
+
+def _workspace_filter(workspace_name: str):
+    """Match sessions whose workspace directory is named workspace_name.
+
+    Sessions imported by older `simon record --all` runs stored Claude's
+    mangled project directory (the cwd with every non-alphanumeric
+    character replaced by "-", e.g. "-home-user-proj") rather than the
+    cwd itself, so their generated workspace_name is the whole mangled
+    string. Those rows (no "/" in workspace_path) match on the mangled
+    "-<name>" suffix, written as a prefix match on the reversed path so
+    it can use idx_agent_sessions_workspace_mangled.
 
     Args:
-        skill: The installed skill to score.
-        prompt_words: Set of lowercase keywords from the prompt classification.
+        workspace_name: Lowercased workspace directory name.
 
     Returns:
-        Tuple of (relevance_score 0.0-1.0, skill body text).
+        SQL boolean expression for the WHERE clause.
+    """
+    # Mangling leaves only alphanumerics and "-", so no LIKE escaping needed
+    mangled_suffix = _MANGLE_RE.sub("-", f"/{workspace_name}")
+    return or_(
+        AgentSession.workspace_name == workspace_name,
+        and_(
+            # Inlined so the planner can match the partial index predicate
+            AgentSession.workspace_path.not_like(literal_column("'%/%'")),
+            func.reverse(func.lower(AgentSession.workspace_path)).like(mangled_suffix[::-1] + "%"),
+        ),
+    )
+
+
+def _in_project_order(rows: Iterable[Row], project_ids: list[UUID]) -> list:
+    """Order (entity, project ID) rows by project, keeping rank order within each.
+
+    Args:
+        rows: Rows from a _top_per_project select.
+        project_ids: Projects in the order their rows should appear.
+
+    Returns:
+        The entities, grouped by project in project_ids order.
+    """
+    position = {pid: i for i, pid in enumerate(project_ids)}
+    return [row[0] for row in sorted(rows, key=lambda row: position[row[1]])]
+
+
+async def _run_in_session(
+    session_factory: async_sessionmaker[AsyncSession],
+    helper: Callable[..., Awaitable[list[ContextBlock]]],
+    *args: Any,
+    **kwargs: Any,
+) -> list[ContextBlock]:
+    """Run one retriever query on a session of its own.
+
+    Args:
+        session_factory: Factory for the query's database session.
+        helper: Bound retriever method taking the session as first argument.
+        *args: Positional arguments for helper.
+        **kwargs: Keyword arguments for helper.
+
+    Returns:
+        The helper's ContextBlocks.
+    """
+    async with session_factory() as session:
+        return await helper(session, *args, **kwargs)
+
+
+def _bloom_filter(words: Iterable[str]) -> int:
+    """Fold words into a 64-bit Bloom filter with one bit per word.
+
+    Two filters with no common bit are guaranteed to share no word.
+
+    Args:
+        words: The words to add.
+
+    Returns:
+        The filter as an int.
+    """
+    bloom = 0
+    for word in words:
+        bloom |= 1 << (hash(word) & 63)
+    return bloom
+
+
+@dataclass(frozen=True, slots=True)
+class _SkillIndex:
+    """Keyword data for one version of a SKILL.md file."""
+
+    keywords: frozenset[str]
+    name_parts: frozenset[str]
+    body: str  # after the frontmatter, stripped
+    bloom: int
+
+
+def _skill_index(skill: InstalledSkill) -> _SkillIndex:
+    """Return a skill's keyword index.
+
+    Args:
+        skill: The installed skill.
+
+    Returns:
+        The skill's _SkillIndex.
     """
-    # Build the skill's keyword set from name + description + body
-    skill_words = set()
-    skill_words.update(re.split(r"[_\-\s]+", skill.name.lower()))
-    if skill.description:
-        skill_words.update(re.split(r"[\s,.\-_]+", skill.description.lower()))
-
-    # Read body for deeper matching
-    body = ""
     try:
-        body = skill.path.read_text()
-    except (OSError, IOError):
-        pass
+        return _load_skill_index(
+            str(skill.path), skill.path.stat().st_mtime_ns, skill.name, skill.description
+        )
+    except OSError:
+        # Unreadable files still match on name and description
+        return _build_skill_index(skill.name, skill.description, "")
 
-    if body:
-        # Extract body after frontmatter
-        parts = body.split("---", 2)
-        if len(parts) >= 3:
-            body_text = parts[2].strip()
-        else:
-            body_text = body
-        # Add first ~200 words from body to keyword set
-        body_words = re.split(r"[\s,.\-_:;()]+", body_text.lower())[:200]
-        skill_words.update(w for w in body_words if len(w) > 2)
+
+@functools.lru_cache(maxsize=256)
+def _load_skill_index(
+    path_str: str,
+    mtime_ns: int,
+    name: str,
+    description: str,
+) -> _SkillIndex:
+    """Read a SKILL.md file and build its keyword index.
+
+    mtime_ns is only part of the cache key, so an edited file is re-read
+    on its next use while unchanged ones cost no I/O.
+
+    Args:
+        path_str: Path to the SKILL.md file.
+        mtime_ns: The file's modification time in nanoseconds.
+        name: The skill's name.
+        description: The skill's description.
+
+    Returns:
+        The skill's _SkillIndex.
+    """
+    return _build_skill_index(name, description, Path(path_str).read_text())
+
+
+def _build_skill_index(name: str, description: str, content: str) -> _SkillIndex:
+    """Build a skill's keyword set from name + description + body.
+
+    Args:
+        name: The skill's name.
+        description: The skill's description.
+        content: Raw SKILL.md content, or "" if it couldn't be read.
+
+    Returns:
+        The skill's _SkillIndex.
+    """
+    name_lower = name.lower()
+    skill_words = set(_NAME_SPLIT_RE.split(name_lower))
+    if description:
+        skill_words.update(_DESCRIPTION_SPLIT_RE.split(description.lower()))
+
+    # Body after frontmatter; parsed once per file version and reused
+    # when the skill is formatted
+    _, body = _split_frontmatter(content)
+    # Add first ~200 words from body to keyword set
+    skill_words.update(_BODY_SPLIT_RE.split(body.lower())[:200])
 
     # Filter out common/short words
-    skill_words = {w for w in skill_words if len(w) > 2}
+    keywords = frozenset(w for w in skill_words if len(w) > 2)
+    return _SkillIndex(
+        keywords=keywords,
+        name_parts=frozenset(_NAME_PARTS_SPLIT_RE.split(name_lower)),
+        body=body,
+        bloom=_bloom_filter(keywords),
+    )
+
 
-    if not skill_words:
-        return 0.0, body
+def _score_skill_relevance(index: _SkillIndex, prompt_words: frozenset[str]) -> float:
+    """Score how relevant a skill is to the current prompt.
+
+    Args:
+        index: The skill's keyword index.
+        prompt_words: Lowercase keywords from the prompt classification.
 
+    Returns:
+        Relevance score 0.0-1.0.
+    """
     # Compute overlap
-    overlap = prompt_words & skill_words
+    overlap = prompt_words & index.keywords
     if not overlap:
-        return 0.0, body
+        return 0.0
 
     # Score: fraction of prompt words that matched, weighted by total matches
     coverage = len(overlap) / len(prompt_words)
     # Bonus for name match (skill name directly matches a prompt keyword)
-    name_parts = set(re.split(r"[_\-]+", skill.name.lower()))
-    name_overlap = prompt_words & name_parts
-    name_bonus = 0.3 if name_overlap else 0.0
+    name_bonus = 0.3 if not prompt_words.isdisjoint(index.name_parts) else 0.0
 
-    score = min(1.0, coverage + name_bonus)
-    return score, body
+    return min(1.0, coverage + name_bonus)
 
 
-def _format_skill_content(skill: InstalledSkill, raw_content: str) -> str:
+def _format_skill_content(skill: InstalledSkill, body: str) -> str:
     """Format skill content for context injection.
 
     Includes the skill description and a truncated body.
 
     Args:
         skill: The installed skill.
-        raw_content: Raw SKILL.md content from disk.
+        body: SKILL.md body after the frontmatter.
 
     Returns:
         Formatted content string.
     """
     parts = [skill.description] if skill.description else []
 
-    # Extract body after frontmatter
-    if raw_content:
-        sections = raw_content.split("---", 2)
-        if len(sections) >= 3:
-            body = sections[2].strip()
-        else:
-            body = raw_content.strip()
-
+    if body:
         # Truncate body to ~300 chars
         if len(body) > 300:
             body = body[:297] + "..."
@@ -614,11 +892,12 @@ def _format_skill_content(skill: InstalledSkill, raw_content: str) -> str:
     return " | ".join(parts)
 
 
-def _relative_time(dt: Optional[datetime]) -> str:
+def _relative_time(dt: Optional[datetime], now: Optional[datetime] = None) -> str:
     """Format a datetime as a relative time string.
 
     Args:
         dt: The datetime to format.
+        now: Reference time; defaults to the current time.
 
     Returns:
         Human-readable relative time (e.g., "2h ago", "3d ago").
@@ -626,7 +905,7 @@ def _relative_time(dt: Optional[datetime]) -> str:
     if not dt:
         return "unknown time"
 
-    now = datetime.now(timezone.utc)
+    now = now or datetime.now(timezone.utc)
     if dt.tzinfo is None:
         dt = dt.replace(tzinfo=timezone.utc)
 
@@ -1,16 +1,21 @@
 """Background worker for processing context system jobs."""
 
 import asyncio
+import functools
+import itertools
 import logging
-import re
 import signal
-from typing import Optional
+import time
+from collections import OrderedDict
+from operator import attrgetter
+from typing import Callable, Optional
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from simon.context.classifier import build_key_matcher, no_matches
 from simon.storage.db import get_session
-from simon.storage.jobs import claim_job, complete_job, expire_stale_leases, fail_job
+from simon.storage.jobs import claim_jobs_batch, complete_jobs, expire_stale_leases, fail_jobs
 from simon.storage.models import (
     AgentSession,
     AgentTurn,
@@ -33,6 +38,55 @@ JOB_KINDS = [
     "skill_extract",
 ]
 
+# Child jobs enqueued for every newly recorded turn, as (kind, priority)
+_TURN_JOB_PRIORITIES = (
+    ("turn_summary", 15),
+    ("entity_extract", 20),
+    ("artifact_extract", 18),
+)
+
+_TURN_SUMMARY_SYSTEM = (
+    "Generate a short title (5-10 words) and a 1-sentence summary of what the user "
+    "asked/discussed. Return as: TITLE: <title>\nSUMMARY: <summary>"
+)
+
+# Recent turn summaries, (model, message) -> (title, summary), in LRU order
+_TURN_SUMMARY_CACHE_SIZE = 1024
+_turn_summary_cache: OrderedDict[tuple[str, str], tuple[str, str]] = OrderedDict()
+
+# (event loop, api key, AsyncAnthropic, Semaphore); see _get_anthropic_client
+_anthropic_client: Optional[tuple] = None
+
+# How long entity extraction reuses its project/person snapshot
+_KNOWN_ENTITIES_TTL_SECONDS = 30.0
+
+# (loaded_at monotonic, projects, people); see _get_known_entities
+_known_entities: Optional[tuple[float, tuple[tuple, ...], tuple[tuple, ...]]] = None
+
+# Max jobs from one claimed batch dispatched concurrently, each on its own
+# reused session; this stays well inside the pool size
+_JOB_CONCURRENCY = 8
+
+# Max length of agent_sessions.session_summary
+_SESSION_SUMMARY_MAX_CHARS = 500
+
+_by_turn_number = attrgetter("turn_number")
+
+# Jobs claimed per iteration of run_worker
+_WORKER_BATCH_SIZE = 20
+
+# Dependency stage per job kind. A batch runs stage by stage; jobs within
+# a stage are independent, so a session's per-turn jobs overlap with each
+# other but its session summary still waits for them
+_JOB_STAGES = {
+    "session_process": 0,
+    "turn_summary": 1,
+    "entity_extract": 1,
+    "artifact_extract": 1,
+    "session_summary": 2,
+    "skill_extract": 3,
+}
+
 
 def _handle_shutdown(signum, frame):
     """Signal handler for graceful shutdown."""
@@ -41,79 +95,68 @@ def _handle_shutdown(signum, frame):
     logger.info("Worker shutdown signal received")
 
 
-async def process_session_job(job: FocusJob) -> None:
+async def process_session_job(job: FocusJob, session: AsyncSession) -> None:
     """Process a session_process job: parse and store conversation turns.
 
     Args:
         job: The job to process.
+        session: Database session. The caller owns the transaction.
     """
     from simon.context.recorder import record_session
-    from simon.storage.jobs import enqueue_job
+    from simon.storage.jobs import enqueue_jobs_bulk
 
     payload = job.payload
     session_id = payload["session_id"]
     transcript_path = payload["transcript_path"]
     workspace_path = payload.get("workspace_path", "")
 
-    async with get_session() as session:
-        result = await record_session(
-            session=session,
-            session_id=session_id,
-            transcript_path=transcript_path,
-            workspace_path=workspace_path,
-        )
+    result = await record_session(
+        session=session,
+        session_id=session_id,
+        transcript_path=transcript_path,
+        workspace_path=workspace_path,
+    )
+
+    if result.get("error"):
+        raise RuntimeError(f"Recording failed: {result['error']}")
 
-        if result.get("error"):
-            raise RuntimeError(f"Recording failed: {result['error']}")
-
-        # Auto-link to project by workspace path
-        if workspace_path:
-            await _link_session_to_project(session, session_id, workspace_path)
-
-        # Enqueue child jobs for newly recorded turns
-        if result["turns_recorded"] > 0:
-            agent_session = (await session.execute(
-                select(AgentSession).where(AgentSession.session_id == session_id)
-            )).scalar_one_or_none()
-
-            if agent_session:
-                turns = (await session.execute(
-                    select(AgentTurn)
-                    .where(AgentTurn.session_id == agent_session.id)
-                    .where(AgentTurn.assistant_summary.is_(None))
-                )).scalars().all()
-
-                for turn in turns:
-                    await enqueue_job(
-                        session=session,
-                        kind="turn_summary",
-                        payload={"turn_id": str(turn.id)},
-                        dedupe_key=f"turn_summary:{turn.id}",
-                        priority=15,
-                    )
-                    await enqueue_job(
-                        session=session,
-                        kind="entity_extract",
-                        payload={"turn_id": str(turn.id)},
-                        dedupe_key=f"entity_extract:{turn.id}",
-                        priority=20,
-                    )
-                    await enqueue_job(
-                        session=session,
-                        kind="artifact_extract",
-                        payload={"turn_id": str(turn.id)},
-                        dedupe_key=f"artifact_extract:{turn.id}",
-                        priority=18,
-                    )
-
-                # Session summary job (lower priority, runs after turns)
-                await enqueue_job(
-                    session=session,
-                    kind="session_summary",
-                    payload={"session_id": session_id},
-                    dedupe_key=f"session_summary:{session_id}",
-                    priority=25,
-                )
+    # Auto-link to project by workspace path
+    if workspace_path:
+        await _link_session_to_project(session, session_id, workspace_path)
+
+    # Enqueue child jobs for newly recorded turns
+    if result["turns_recorded"] > 0:
+        agent_session = (await session.execute(
+            select(AgentSession).where(AgentSession.session_id == session_id)
+        )).scalar_one_or_none()
+
+        if agent_session:
+            turn_ids = (await session.execute(
+                select(AgentTurn.id)
+                .where(AgentTurn.session_id == agent_session.id)
+                .where(AgentTurn.assistant_summary.is_(None))
+            )).scalars().all()
+
+            rows = []
+            for turn_id in turn_ids:
+                for kind, priority in _TURN_JOB_PRIORITIES:
+                    rows.append({
+                        "kind": kind,
+                        "payload": {"turn_id": str(turn_id)},
+                        "dedupe_key": f"{kind}:{turn_id}",
+                        "priority": priority,
+                    })
+
+            # Session summary job (lower priority, runs after turns)
+            rows.append({
+                "kind": "session_summary",
+                "payload": {"session_id": session_id},
+                "dedupe_key": f"session_summary:{session_id}",
+                "priority": 25,
+            })
+
+            # One INSERT for the whole fan-out rather than one per job
+            await enqueue_jobs_bulk(session, rows)
 
     logger.info(
         "Session job done: %s (%d recorded, %d skipped)",
@@ -162,49 +205,52 @@ async def _link_session_to_project(
             logger.info("Linked session %s to project %s", session_id[:12], project.slug)
 
 
-async def process_turn_summary_job(job: FocusJob) -> None:
+async def process_turn_summary_job(job: FocusJob, session: AsyncSession) -> None:
     """Generate LLM summary for a single conversation turn.
 
     Args:
         job: The job to process. Payload must contain turn_id.
+        session: Database session. The caller owns the transaction.
     """
     import uuid
 
     turn_id = uuid.UUID(job.payload["turn_id"])
 
-    async with get_session() as session:
-        turn = await session.get(AgentTurn, turn_id)
-        if not turn:
-            logger.warning("Turn %s not found, skipping summary", turn_id)
-            return
+    turn = await session.get(AgentTurn, turn_id)
+    if not turn:
+        logger.warning("Turn %s not found, skipping summary", turn_id)
+        return
 
-        if turn.assistant_summary:
-            return
+    if turn.assistant_summary:
+        return
 
-        # Build summary from user message (no LLM call if message is short)
-        user_msg = (turn.user_message or "")[:200]
-        if len(user_msg) < 50:
-            turn.turn_title = user_msg[:80] if user_msg else "Short exchange"
-            turn.assistant_summary = user_msg
-            await session.flush()
-            return
+    # Build summary from user message (no LLM call if message is short)
+    user_msg = (turn.user_message or "")[:200]
+    if len(user_msg) < 50:
+        turn.turn_title = user_msg[:80] if user_msg else "Short exchange"
+        turn.assistant_summary = user_msg
+        await session.flush()
+        return
 
-        # Try LLM summarization, fall back to truncation
-        try:
-            title, summary = await _llm_summarize_turn(user_msg)
-            turn.turn_title = title
-            turn.assistant_summary = summary
-        except Exception as e:
-            logger.debug("LLM summary failed, using truncation: %s", e)
-            turn.turn_title = user_msg[:80]
-            turn.assistant_summary = user_msg[:200]
+    # Try LLM summarization, fall back to truncation
+    try:
+        title, summary = await _llm_summarize_turn(user_msg)
+        turn.turn_title = title
+        turn.assistant_summary = summary
+    except Exception as e:
+        logger.debug("LLM summary failed, using truncation: %s", e)
+        turn.turn_title = user_msg[:80]
+        turn.assistant_summary = user_msg[:200]
 
-        await session.flush()
+    await session.flush()
 
 
 async def _llm_summarize_turn(user_message: str) -> tuple[str, str]:
     """Call LLM to generate turn title and summary.
 
+    Results are memoized per (model, message), so replayed or repeated
+    turns don't pay for another API call.
+
     Args:
         user_message: The user's message text.
 
@@ -221,15 +267,26 @@ async def _llm_summarize_turn(user_message: str) -> tuple[str, str]:
     if not settings.anthropic.api_key:
         raise RuntimeError("No Anthropic API key")
 
-    import anthropic
+    model = settings.context.turn_summary_model
+    prompt = user_message[:1000]
+    cache_key = (model, prompt)
+    cached = _turn_summary_cache.get(cache_key)
+    if cached is not None:
+        _turn_summary_cache.move_to_end(cache_key)
+        return cached
 
-    client = anthropic.Anthropic(api_key=settings.anthropic.api_key)
-    response = client.messages.create(
-        model=settings.context.turn_summary_model,
-        max_tokens=200,
-        system="Generate a short title (5-10 words) and a 1-sentence summary of what the user asked/discussed. Return as: TITLE: <title>\nSUMMARY: <summary>",
-        messages=[{"role": "user", "content": user_message[:1000]}],
+    client, limit = _get_anthropic_client(
+        settings.anthropic.api_key, settings.context.turn_summary_concurrency,
     )
+    # Awaiting the async client lets other jobs in the batch run while the
+    # request is in flight; the semaphore keeps us under the rate limit
+    async with limit:
+        response = await client.messages.create(
+            model=model,
+            max_tokens=200,
+            system=_TURN_SUMMARY_SYSTEM,
+            messages=[{"role": "user", "content": prompt}],
+        )
 
     text = response.content[0].text
     title = ""
@@ -241,268 +298,350 @@ async def _llm_summarize_turn(user_message: str) -> tuple[str, str]:
         elif line.startswith("SUMMARY:"):
             summary = line[8:].strip()
 
-    return title or user_message[:80], summary or user_message[:200]
+    result = (title or user_message[:80], summary or user_message[:200])
+    _turn_summary_cache[cache_key] = result
+    if len(_turn_summary_cache) > _TURN_SUMMARY_CACHE_SIZE:
+        _turn_summary_cache.popitem(last=False)
+    return result
 
 
-async def process_entity_extract_job(job: FocusJob) -> None:
+def _get_anthropic_client(api_key: str, concurrency: int) -> tuple:
+    """Return the Anthropic client and request semaphore for this event loop.
+
+    Reusing the client keeps its HTTP connection pool, so consecutive
+    summaries skip connection and TLS setup. Both the async client's pool
+    and the semaphore belong to the loop they're used on, so they are
+    rebuilt when called from a different loop (e.g. another asyncio.run).
+
+    Args:
+        api_key: Anthropic API key.
+        concurrency: Max summary requests in flight at once.
+
+    Returns:
+        Tuple of (anthropic.AsyncAnthropic, asyncio.Semaphore).
+    """
+    global _anthropic_client
+
+    loop = asyncio.get_running_loop()
+    if _anthropic_client is None or _anthropic_client[:2] != (loop, api_key):
+        import anthropic
+
+        _anthropic_client = (
+            loop,
+            api_key,
+            anthropic.AsyncAnthropic(api_key=api_key),
+            asyncio.Semaphore(max(concurrency, 1)),
+        )
+    return _anthropic_client[2], _anthropic_client[3]
+
+
+async def _get_known_entities(
+    session: AsyncSession,
+) -> tuple[tuple[tuple, ...], tuple[tuple, ...]]:
+    """Return the active projects and people, reloading at most every TTL.
+
+    Entity extraction runs once per turn, so without this a 50-turn
+    session reloads the same two tables 50 times. New or renamed entities
+    are picked up within _KNOWN_ENTITIES_TTL_SECONDS.
+
+    Args:
+        session: Database session used on a cache miss.
+
+    Returns:
+        ((id, slug, name) project rows, (id, name) person rows).
+    """
+    global _known_entities
+
+    now = time.monotonic()
+    if _known_entities is not None and now - _known_entities[0] < _KNOWN_ENTITIES_TTL_SECONDS:
+        return _known_entities[1], _known_entities[2]
+
+    # Only the columns the matcher is keyed on
+    projects = tuple((await session.execute(
+        select(Project.id, Project.slug, Project.name).where(Project.status == "active")
+    )).tuples())
+    people = tuple((await session.execute(
+        select(Person.id, Person.name)
+    )).tuples())
+
+    _known_entities = (now, projects, people)
+    return projects, people
+
+
+@functools.lru_cache(maxsize=1)
+def _entity_matcher(
+    projects: tuple[tuple, ...],
+    people: tuple[tuple, ...],
+) -> Callable[[str], set]:
+    """Build (and cache) the keyword matcher for entity extraction.
+
+    Keyed on the loaded rows themselves, so the automaton is rebuilt
+    only when a project or person is added, renamed or removed.
+
+    Args:
+        projects: (id, slug, name) rows of active projects.
+        people: (id, name) rows of people.
+
+    Returns:
+        Callable taking lowercase text and returning a set of
+        (entity_type, entity_id, entity_name, confidence) tuples.
+    """
+    entities_by_key: dict[str, list[tuple]] = {}
+    for project_id, slug, name in projects:
+        if slug:
+            entities_by_key.setdefault(slug.lower(), []).append(("project", project_id, name, 0.9))
+        if name:
+            entities_by_key.setdefault(name.lower(), []).append(("project", project_id, name, 0.7))
+    for person_id, name in people:
+        if name and len(name) > 2:
+            entities_by_key.setdefault(name.lower(), []).append(("person", person_id, name, 0.8))
+
+    if not entities_by_key:
+        return no_matches
+    return build_key_matcher({key: tuple(entities) for key, entities in entities_by_key.items()})
+
+
+async def process_entity_extract_job(job: FocusJob, session: AsyncSession) -> None:
     """Extract entity mentions from a turn using keyword matching.
 
     Scans user_message and assistant_text against known projects and people.
 
     Args:
         job: The job to process. Payload must contain turn_id.
+        session: Database session. The caller owns the transaction.
     """
     import uuid
 
-    from sqlalchemy.orm import selectinload
+    from sqlalchemy.orm import joinedload
+
+    from simon.storage.models import AgentTurnContent
 
     turn_id = uuid.UUID(job.payload["turn_id"])
 
-    async with get_session() as session:
-        turn = await session.get(
-            AgentTurn,
-            turn_id,
-            options=[selectinload(AgentTurn.content)],
-        )
-        if not turn:
-            return
+    # One LEFT JOIN for turn + content (one-to-one); only assistant_text
+    # is scanned, so leave the potentially large raw_jsonl behind
+    turn = await session.get(
+        AgentTurn,
+        turn_id,
+        options=[joinedload(AgentTurn.content).load_only(AgentTurnContent.assistant_text)],
+    )
+    if not turn:
+        return
 
-        # Build searchable text
-        text_parts = []
-        if turn.user_message:
-            text_parts.append(turn.user_message)
-        if turn.content and turn.content.assistant_text:
-            text_parts.append(turn.content.assistant_text)
-        full_text = "\n".join(text_parts).lower()
+    # Build searchable text
+    text_parts = []
+    if turn.user_message:
+        text_parts.append(turn.user_message)
+    if turn.content and turn.content.assistant_text:
+        text_parts.append(turn.content.assistant_text)
+    full_text = "\n".join(text_parts).lower()
 
-        if not full_text:
-            return
+    if not full_text:
+        return
 
-        # Load known entities
-        projects = (await session.execute(
-            select(Project).where(Project.status == "active")
-        )).scalars().all()
-
-        people = (await session.execute(
-            select(Person)
-        )).scalars().all()
-
-        # Match projects
-        for project in projects:
-            pattern = re.compile(r'\b' + re.escape(project.slug) + r'\b', re.IGNORECASE)
-            if pattern.search(full_text):
-                entity = AgentTurnEntity(
-                    turn_id=turn_id,
-                    entity_type="project",
-                    entity_id=project.id,
-                    entity_name=project.name,
-                    confidence=0.9,
-                )
-                session.add(entity)
-            elif project.name and re.search(
-                r'\b' + re.escape(project.name.lower()) + r'\b', full_text
-            ):
-                entity = AgentTurnEntity(
-                    turn_id=turn_id,
-                    entity_type="project",
-                    entity_id=project.id,
-                    entity_name=project.name,
-                    confidence=0.7,
-                )
-                session.add(entity)
-
-        # Match people
-        for person in people:
-            if person.name and len(person.name) > 2:
-                if re.search(r'\b' + re.escape(person.name.lower()) + r'\b', full_text):
-                    entity = AgentTurnEntity(
-                        turn_id=turn_id,
-                        entity_type="person",
-                        entity_id=person.id,
-                        entity_name=person.name,
-                        confidence=0.8,
-                    )
-                    session.add(entity)
+    projects, people = await _get_known_entities(session)
 
-        await session.flush()
+    # One scan of the text for every project and person key, keeping
+    # each entity's best match (a slug beats a project name)
+    best: dict[tuple[str, uuid.UUID], tuple[str, float]] = {}
+    for entity_type, entity_id, entity_name, confidence in _entity_matcher(projects, people)(full_text):
+        key = (entity_type, entity_id)
+        if key not in best or confidence > best[key][1]:
+            best[key] = (entity_name, confidence)
+
+    for (entity_type, entity_id), (entity_name, confidence) in best.items():
+        session.add(AgentTurnEntity(
+            turn_id=turn_id,
+            entity_type=entity_type,
+            entity_id=entity_id,
+            entity_name=entity_name,
+            confidence=confidence,
+        ))
+
+    await session.flush()
 
 
-async def process_artifact_extract_job(job: FocusJob) -> None:
+async def process_artifact_extract_job(job: FocusJob, session: AsyncSession) -> None:
     """Extract artifacts (files, commands, errors) from a turn's raw JSONL.
 
     Args:
         job: The job to process. Payload must contain turn_id.
+        session: Database session. The caller owns the transaction.
     """
     import uuid
 
-    from sqlalchemy.orm import selectinload
+    from sqlalchemy.orm import joinedload
 
     from simon.context.artifact_extractor import extract_artifacts
     from simon.storage.models import AgentTurnArtifact
 
     turn_id = uuid.UUID(job.payload["turn_id"])
 
-    async with get_session() as session:
-        turn = await session.get(
-            AgentTurn,
-            turn_id,
-            options=[selectinload(AgentTurn.content)],
-        )
-        if not turn or not turn.content:
-            return
-
-        raw_jsonl = turn.content.raw_jsonl
-        if not raw_jsonl:
-            return
+    # Turn and its one-to-one content in a single LEFT JOIN
+    turn = await session.get(
+        AgentTurn,
+        turn_id,
+        options=[joinedload(AgentTurn.content)],
+    )
+    if not turn or not turn.content:
+        return
 
-        artifacts = extract_artifacts(raw_jsonl)
-
-        # Store individual artifacts
-        for artifact in artifacts.artifacts:
-            session.add(AgentTurnArtifact(
-                turn_id=turn_id,
-                artifact_type=artifact.artifact_type,
-                artifact_value=artifact.artifact_value,
-                artifact_metadata=artifact.artifact_metadata,
-            ))
-
-        # Update summary columns on content
-        if artifacts.files_touched:
-            turn.content.files_touched = artifacts.files_touched
-        if artifacts.commands_run:
-            turn.content.commands_run = artifacts.commands_run
-        if artifacts.errors_encountered:
-            turn.content.errors_encountered = artifacts.errors_encountered
-        turn.content.tool_call_count = artifacts.tool_call_count
+    raw_jsonl = turn.content.raw_jsonl
+    if not raw_jsonl:
+        return
 
-        await session.flush()
-        logger.info(
-            "Artifacts extracted for turn %s: %d artifacts, %d files, %d commands, %d errors",
-            turn_id, len(artifacts.artifacts), len(artifacts.files_touched),
-            len(artifacts.commands_run), len(artifacts.errors_encountered),
-        )
+    artifacts = extract_artifacts(raw_jsonl)
+
+    # Store individual artifacts
+    for artifact in artifacts.artifacts:
+        session.add(AgentTurnArtifact(
+            turn_id=turn_id,
+            artifact_type=artifact.artifact_type,
+            artifact_value=artifact.artifact_value,
+            artifact_metadata=artifact.artifact_metadata,
+        ))
+
+    # Update summary columns on content
+    if artifacts.files_touched:
+        turn.content.files_touched = artifacts.files_touched
+    if artifacts.commands_run:
+        turn.content.commands_run = artifacts.commands_run
+    if artifacts.errors_encountered:
+        turn.content.errors_encountered = artifacts.errors_encountered
+    turn.content.tool_call_count = artifacts.tool_call_count
+
+    await session.flush()
+    logger.info(
+        "Artifacts extracted for turn %s: %d artifacts, %d files, %d commands, %d errors",
+        turn_id, len(artifacts.artifacts), len(artifacts.files_touched),
+        len(artifacts.commands_run), len(artifacts.errors_encountered),
+    )
 
 
-async def process_session_summary_job(job: FocusJob) -> None:
+async def process_session_summary_job(job: FocusJob, session: AsyncSession) -> None:
     """Generate aggregate session summary from turn summaries.
 
     Args:
         job: The job to process. Payload must contain session_id.
+        session: Database session. The caller owns the transaction.
     """
-    cc_session_id = job.payload["session_id"]
-
-    async with get_session() as session:
-        agent_session = (await session.execute(
-            select(AgentSession)
-            .options(
-                __import__("sqlalchemy.orm", fromlist=["selectinload"]).selectinload(AgentSession.turns)
-            )
-            .where(AgentSession.session_id == cc_session_id)
-        )).scalar_one_or_none()
+    from simon.storage.jobs import enqueue_job
 
-        if not agent_session:
-            return
+    cc_session_id = job.payload["session_id"]
 
-        # Build summary from turn titles/summaries
-        parts = []
-        for turn in sorted(agent_session.turns, key=lambda t: t.turn_number):
-            if turn.turn_title:
-                parts.append(turn.turn_title)
-            elif turn.user_message:
-                parts.append(turn.user_message[:80])
+    agent_session = (await session.execute(
+        select(AgentSession)
+        .options(
+            __import__("sqlalchemy.orm", fromlist=["selectinload"]).selectinload(AgentSession.turns)
+        )
+        .where(AgentSession.session_id == cc_session_id)
+    )).scalar_one_or_none()
 
-        if not parts:
-            return
+    if not agent_session:
+        return
 
-        # Simple concatenation for session title/summary
-        agent_session.session_title = parts[0][:100] if parts else None
-        agent_session.session_summary = "; ".join(parts)[:500]
-        agent_session.is_processed = True
+    # Build summary from turn titles/summaries, stopping once the joined
+    # text reaches the cap rather than joining every turn and truncating
+    parts = []
+    length = -2  # no "; " before the first part
+    for turn in sorted(agent_session.turns, key=_by_turn_number):
+        part = turn.turn_title or (turn.user_message or "")[:80]
+        if not part:
+            continue
+        parts.append(part)
+        length += len(part) + 2
+        if length >= _SESSION_SUMMARY_MAX_CHARS:
+            break
+
+    if not parts:
+        return
 
-        await session.flush()
-        logger.info("Session summary generated: %s", cc_session_id[:12])
-
-        # Enqueue skill extraction (low priority, runs after everything else)
-        await enqueue_job(
-            session=session,
-            kind="skill_extract",
-            payload={"session_id": cc_session_id},
-            dedupe_key=f"skill_extract:{cc_session_id}",
-            priority=30,
-        )
+    # Simple concatenation for session title/summary
+    agent_session.session_title = parts[0][:100]
+    agent_session.session_summary = "; ".join(parts)[:_SESSION_SUMMARY_MAX_CHARS]
+    agent_session.is_processed = True
+
+    await session.flush()
+    logger.info("Session summary generated: %s", cc_session_id[:12])
+
+    # Enqueue skill extraction (low priority, runs after everything else)
+    await enqueue_job(
+        session=session,
+        kind="skill_extract",
+        payload={"session_id": cc_session_id},
+        dedupe_key=f"skill_extract:{cc_session_id}",
+        priority=30,
+    )
 
 
-async def process_skill_extract_job(job: FocusJob) -> None:
+async def process_skill_extract_job(job: FocusJob, session: AsyncSession) -> None:
     """Analyze a completed session and auto-generate a skill if it qualifies.
 
     Args:
         job: The job to process. Payload must contain session_id.
+        session: Database session. The caller owns the transaction.
     """
-    from simon.skills.analyzer import analyze_session_for_skill
+    from simon.skills.analyzer import _compute_description_hash, analyze_session_for_skill
     from simon.skills.generator import generate_skill_md
     from simon.skills.installer import install_skill as install_skill_to_disk
 
     cc_session_id = job.payload["session_id"]
 
-    async with get_session() as session:
-        agent_session = (await session.execute(
-            select(AgentSession)
-            .where(AgentSession.session_id == cc_session_id)
-        )).scalar_one_or_none()
+    agent_session = (await session.execute(
+        select(AgentSession)
+        .where(AgentSession.session_id == cc_session_id)
+    )).scalar_one_or_none()
 
-        if not agent_session:
-            return
+    if not agent_session:
+        return
 
-        candidate = await analyze_session_for_skill(session, agent_session)
-        if not candidate:
-            logger.debug("Session %s did not qualify for skill", cc_session_id[:12])
-            return
+    candidate = await analyze_session_for_skill(session, agent_session)
+    if not candidate:
+        logger.debug("Session %s did not qualify for skill", cc_session_id[:12])
+        return
+
+    skill = await generate_skill_md(
+        description=candidate.description,
+        context=candidate.context,
+        source="auto",
+    )
+    if not skill:
+        logger.debug("Skill generation failed for session %s", cc_session_id[:12])
+        return
+
+    try:
+        path = install_skill_to_disk(name=skill.name, content=skill.full_content)
+        logger.info(
+            "Auto-generated skill '%s' from session %s -> %s",
+            skill.name, cc_session_id[:12], path,
+        )
+
+        # Record in database for dedup tracking
+        from simon.storage.models import GeneratedSkillRecord
 
-        skill = await generate_skill_md(
-            description=candidate.description,
-            context=candidate.context,
+        record = GeneratedSkillRecord(
+            name=skill.name,
+            description=skill.description,
             source="auto",
+            source_session_id=cc_session_id,
+            installed_path=str(path),
+            scope="personal",
+            quality_score=candidate.quality_score,
+            skill_content_hash=_compute_description_hash(skill.description),
         )
-        if not skill:
-            logger.debug("Skill generation failed for session %s", cc_session_id[:12])
-            return
+        session.add(record)
+        await session.flush()
 
-        try:
-            path = install_skill_to_disk(name=skill.name, content=skill.full_content)
-            logger.info(
-                "Auto-generated skill '%s' from session %s -> %s",
-                skill.name, cc_session_id[:12], path,
-            )
-
-            # Record in database for dedup tracking
-            import hashlib
-
-            from simon.storage.models import GeneratedSkillRecord
-
-            record = GeneratedSkillRecord(
-                name=skill.name,
-                description=skill.description,
-                source="auto",
-                source_session_id=cc_session_id,
-                installed_path=str(path),
-                scope="personal",
-                quality_score=candidate.quality_score,
-                skill_content_hash=hashlib.md5(
-                    " ".join(skill.description.lower().split()).encode()
-                ).hexdigest(),
-            )
-            session.add(record)
-            await session.flush()
-
-        except (FileExistsError, ValueError) as e:
-            logger.debug("Skipped skill for session %s: %s", cc_session_id[:12], e)
-
-
-async def _dispatch_job(job: FocusJob) -> None:
+    except (FileExistsError, ValueError) as e:
+        logger.debug("Skipped skill for session %s: %s", cc_session_id[:12], e)
+
+
+async def _dispatch_job(job: FocusJob, session: AsyncSession) -> None:
     """Dispatch a job to the appropriate handler.
 
     Args:
         job: The job to dispatch.
+        session: Database session the handler works in.
 
     Raises:
         ValueError: If job kind is unknown.
@@ -520,13 +659,15 @@ async def _dispatch_job(job: FocusJob) -> None:
     if not handler:
         raise ValueError(f"Unknown job kind: {job.kind}")
 
-    await handler(job)
+    await handler(job, session)
 
 
 async def process_pending_jobs(max_jobs: int = 20) -> int:
     """Process up to max_jobs pending jobs.
 
-    For embedding in the daemon cycle or one-shot processing.
+    For embedding in the daemon cycle or one-shot processing. The batch
+    is claimed in one statement and completed/failed in one more, instead
+    of a transaction per job.
 
     Args:
         max_jobs: Maximum number of jobs to process.
@@ -534,26 +675,69 @@ async def process_pending_jobs(max_jobs: int = 20) -> int:
     Returns:
         Number of jobs processed successfully.
     """
-    processed = 0
-
     async with get_session() as session:
         await expire_stale_leases(session)
+        jobs = await claim_jobs_batch(session, kinds=JOB_KINDS, limit=max_jobs)
 
-    for _ in range(max_jobs):
-        async with get_session() as session:
-            job = await claim_job(session, kinds=JOB_KINDS)
-            if not job:
-                break
+    if not jobs:
+        return 0
+    return await _run_job_batch(jobs)
 
-            try:
-                await _dispatch_job(job)
-                await complete_job(session, job.id)
-                processed += 1
-            except Exception as e:
-                logger.error("Job %s (%s) failed: %s", job.id, job.kind, e)
-                await fail_job(session, job.id, str(e))
 
-    return processed
+async def _run_job_batch(jobs: list[FocusJob]) -> int:
+    """Dispatch a claimed batch and record every outcome in one session.
+
+    Jobs run concurrently within each dependency stage, on at most
+    _JOB_CONCURRENCY sessions that are reused across jobs, and stages
+    run in order.
+
+    Args:
+        jobs: Claimed jobs, in priority order.
+
+    Returns:
+        Number of jobs processed successfully.
+    """
+    succeeded: list = []
+    failures: list[tuple] = []
+
+    async def _lane(pending) -> None:
+        # One session (connection + transaction) per lane instead of per
+        # job; a SAVEPOINT per job rolls back only that job on failure.
+        # Lanes pull from a shared iterator, so a slow job doesn't hold
+        # up work that another lane could take.
+        done: list[FocusJob] = []
+        try:
+            async with get_session() as session:
+                for job in pending:
+                    try:
+                        async with session.begin_nested():
+                            await _dispatch_job(job, session)
+                    except Exception as e:
+                        logger.error("Job %s (%s) failed: %s", job.id, job.kind, e)
+                        failures.append((job.id, str(e)))
+                    else:
+                        done.append(job)
+        except Exception as e:
+            # The lane's commit failed, so none of its jobs' work was kept
+            logger.error("Job lane commit failed: %s", e)
+            failures.extend((job.id, str(e)) for job in done)
+            return
+        for job in done:
+            logger.debug("Completed job %s (%s)", job.id, job.kind)
+            succeeded.append(job.id)
+
+    # Stages follow priority order, so the priority-sorted batch is
+    # already grouped by stage; unknown kinds fail on dispatch anyway
+    for _, stage in itertools.groupby(jobs, key=lambda job: _JOB_STAGES.get(job.kind, 0)):
+        stage = list(stage)
+        pending = iter(stage)
+        await asyncio.gather(*(_lane(pending) for _ in range(min(_JOB_CONCURRENCY, len(stage)))))
+
+    async with get_session() as session:
+        await complete_jobs(session, succeeded)
+        await fail_jobs(session, failures)
+
+    return len(succeeded)
 
 
 async def run_worker(poll_interval: float = 2.0) -> None:
@@ -574,28 +758,22 @@ async def run_worker(poll_interval: float = 2.0) -> None:
 
     while _running:
         try:
-            # Expire stale leases periodically
+            # Expire stale leases, then claim a batch; jobs within it run
+            # concurrently, so e.g. a session's per-turn jobs overlap
+            # instead of queueing behind each other
             async with get_session() as session:
                 await expire_stale_leases(session)
-
-            # Try to claim and process a job
-            async with get_session() as session:
-                job = await claim_job(session, kinds=JOB_KINDS)
-                if not job:
-                    consecutive_empty += 1
-                    if consecutive_empty % 30 == 0:
-                        logger.debug("No jobs for %d cycles", consecutive_empty)
-                    await asyncio.sleep(poll_interval)
-                    continue
-
-                consecutive_empty = 0
-                try:
-                    await _dispatch_job(job)
-                    await complete_job(session, job.id)
-                    logger.info("Completed job %s (%s)", job.id, job.kind)
-                except Exception as e:
-                    logger.error("Job %s (%s) failed: %s", job.id, job.kind, e)
-                    await fail_job(session, job.id, str(e))
+                jobs = await claim_jobs_batch(session, kinds=JOB_KINDS, limit=_WORKER_BATCH_SIZE)
+            if not jobs:
+                consecutive_empty += 1
+                if consecutive_empty % 30 == 0:
+                    logger.debug("No jobs for %d cycles", consecutive_empty)
+                await asyncio.sleep(poll_interval)
+                continue
+
+            consecutive_empty = 0
+            processed = await _run_job_batch(jobs)
+            logger.info("Completed %d/%d jobs", processed, len(jobs))
 
         except Exception as e:
             logger.error("Worker error: %s", e, exc_info=True)
@@ -7,15 +7,27 @@ session parsing, timestamp handling, content hashing, and turn grouping.
 import hashlib
 import json
 import logging
+import os
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional, Union
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # optional speedup, see the "speedups" extra
+    _json_loads = json.loads
 
 logger = logging.getLogger(__name__)
 
 # Default location for Claude Code session files
 CLAUDE_SESSIONS_DIR = Path.home() / ".claude" / "projects"
 
+# Read buffer for streaming transcripts line by line
+_READ_BUFFER_SIZE = 1 << 20
+
+# Transcript entry types that carry conversation messages
+_MESSAGE_TYPES = frozenset({"user", "assistant"})
+
 
 def _parse_timestamp(ts: Optional[str]) -> Optional[datetime]:
     """Parse an ISO timestamp string, returning None on failure."""
@@ -67,16 +79,22 @@ def _extract_tool_names(content) -> list[str]:
     return tools
 
 
-def compute_content_hash(content: str) -> str:
+def compute_content_hash(content: Union[str, bytes, bytearray]) -> str:
     """Compute MD5 hash for content deduplication.
 
+    The digest is persisted in agent_turns and re-recording a grown
+    transcript relies on it matching earlier runs, so the algorithm must
+    not change without migrating existing rows.
+
     Args:
-        content: Text content to hash.
+        content: Text content to hash, or its UTF-8 encoding.
 
     Returns:
         Hex digest of MD5 hash.
     """
-    return hashlib.md5(content.encode()).hexdigest()
+    if isinstance(content, str):
+        content = content.encode()
+    return hashlib.md5(content, usedforsecurity=False).hexdigest()
 
 
 def _finalize_turn(turn: dict, index: int) -> None:
@@ -86,47 +104,90 @@ def _finalize_turn(turn: dict, index: int) -> None:
         turn: Mutable turn dict to finalize in place.
         index: Zero-based turn index.
     """
-    raw_jsonl = "\n".join(turn.pop("raw_lines"))
+    # raw_buf holds the turn's lines as the raw bytes read; hashing it
+    # directly gives the same digest as hashing the decoded text
+    raw_buf = turn.pop("raw_buf")
     assistant_text = "\n".join(turn.pop("assistant_texts"))
 
     turn["turn_number"] = index
     turn["assistant_text"] = assistant_text
-    turn["raw_jsonl"] = raw_jsonl
-    turn["content_hash"] = compute_content_hash(raw_jsonl)
+    turn["raw_jsonl"] = raw_buf.decode()
+    turn["content_hash"] = compute_content_hash(raw_buf)
+
 
+def read_session_cwd(path: Path) -> Optional[str]:
+    """Return the working directory recorded in a session transcript.
 
-def parse_session_into_turns(path: Path) -> list[dict]:
+    Claude Code writes the session's cwd on its message lines; the first
+    one found is returned. Hooks get the cwd directly, but a scan of
+    CLAUDE_SESSIONS_DIR only knows the mangled project directory name.
+
+    Args:
+        path: Path to the .jsonl session file.
+
+    Returns:
+        The cwd, or None if the file is missing or no line carries one.
+    """
+    try:
+        with open(path, "rb", buffering=_READ_BUFFER_SIZE) as f:
+            for line in f:
+                # Cheap substring check before paying for a JSON parse
+                if b'"cwd"' not in line:
+                    continue
+                try:
+                    obj = _json_loads(line)
+                except ValueError:
+                    continue
+                cwd = obj.get("cwd") if isinstance(obj, dict) else None
+                if isinstance(cwd, str) and cwd:
+                    return cwd
+    except OSError:
+        return None
+    return None
+
+
+def parse_session_into_turns(path: Path) -> Iterator[dict]:
     """Parse a Claude Code JSONL session file into structured turns.
 
     A "turn" is a user message followed by the assistant's complete response
-    (which may include tool calls, thinking, and text blocks).
+    (which may include tool calls, thinking, and text blocks). Turns are
+    yielded as soon as the next user message closes them, so only the turn
+    being built is held in memory.
 
     Args:
         path: Path to the .jsonl session file.
 
-    Returns:
-        List of turn dicts with keys: turn_number, user_message,
-        assistant_text, tool_names, model_name, started_at, ended_at,
-        raw_jsonl, content_hash.
+    Yields:
+        Turn dicts with keys: turn_number, user_message, assistant_text,
+        tool_names, model_name, started_at, ended_at, raw_jsonl,
+        content_hash.
     """
     if not path.exists():
-        return []
+        return
 
-    # First pass: collect all non-sidechain, non-meta messages
-    messages = []
-    with open(path) as f:
+    turn_count = 0
+    current_turn: Optional[dict] = None
+
+    # Binary mode: lines go straight to the JSON parser without a str
+    # decode, and only the ones kept for a turn are ever decoded
+    with open(path, "rb", buffering=_READ_BUFFER_SIZE) as f:
+        if hasattr(os, "posix_fadvise"):
+            # Transcripts are read once front-to-back; ask for aggressive read-ahead
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
         for line in f:
-            line = line.strip()
-            if not line:
+            # The JSON parser tolerates surrounding whitespace, so only
+            # lines kept as messages below get a stripped copy
+            if not line or line.isspace():
                 continue
 
             try:
-                obj = json.loads(line)
-            except json.JSONDecodeError:
+                obj = _json_loads(line)
+            except ValueError:  # json/orjson decode errors, incl. bad UTF-8
                 continue
 
+            # Only non-sidechain, non-meta messages belong to turns
             msg_type = obj.get("type")
-            if msg_type not in ("user", "assistant"):
+            if msg_type not in _MESSAGE_TYPES:
                 continue
 
             if obj.get("isSidechain") or obj.get("isMeta"):
@@ -144,51 +205,41 @@ def parse_session_into_turns(path: Path) -> list[dict]:
             if text_content and text_content.strip().startswith(("<command-name>", "<local-command")):
                 continue
 
-            messages.append({
-                "role": role,
-                "content": content,
-                "text": text_content,
-                "timestamp": obj.get("timestamp", ""),
-                "model": message.get("model", ""),
-                "raw_line": line,
-            })
-
-    # Second pass: group into turns (user message + assistant responses)
-    turns = []
-    current_turn: Optional[dict] = None
-
-    for msg in messages:
-        if msg["role"] == "user":
-            # Start a new turn
-            if current_turn and current_turn.get("user_message"):
-                _finalize_turn(current_turn, len(turns))
-                turns.append(current_turn)
-
-            current_turn = {
-                "user_message": msg["text"],
-                "assistant_texts": [],
-                "tool_names": [],
-                "model_name": None,
-                "started_at": msg["timestamp"],
-                "ended_at": msg["timestamp"],
-                "raw_lines": [msg["raw_line"]],
-            }
-        elif msg["role"] == "assistant" and current_turn is not None:
-            # Append to current turn
-            if msg["text"]:
-                current_turn["assistant_texts"].append(msg["text"])
-            tools = _extract_tool_names(msg["content"])
-            for t in tools:
-                if t not in current_turn["tool_names"]:
-                    current_turn["tool_names"].append(t)
-            if msg["model"] and not current_turn["model_name"]:
-                current_turn["model_name"] = msg["model"]
-            current_turn["ended_at"] = msg["timestamp"] or current_turn["ended_at"]
-            current_turn["raw_lines"].append(msg["raw_line"])
+            timestamp = obj.get("timestamp", "")
+
+            # Group into turns (user message + assistant responses)
+            if role == "user":
+                # Start a new turn
+                if current_turn and current_turn.get("user_message"):
+                    _finalize_turn(current_turn, turn_count)
+                    turn_count += 1
+                    yield current_turn
+
+                current_turn = {
+                    "user_message": text_content,
+                    "assistant_texts": [],
+                    "tool_names": [],
+                    "model_name": None,
+                    "started_at": timestamp,
+                    "ended_at": timestamp,
+                    "raw_buf": bytearray(line.strip()),
+                }
+            elif role == "assistant" and current_turn is not None:
+                # Append to current turn
+                if text_content:
+                    current_turn["assistant_texts"].append(text_content)
+                for t in _extract_tool_names(content):
+                    if t not in current_turn["tool_names"]:
+                        current_turn["tool_names"].append(t)
+                model = message.get("model", "")
+                if model and not current_turn["model_name"]:
+                    current_turn["model_name"] = model
+                current_turn["ended_at"] = timestamp or current_turn["ended_at"]
+                raw_buf = current_turn["raw_buf"]
+                raw_buf += b"\n"
+                raw_buf += line.strip()
 
     # Finalize last turn
     if current_turn and current_turn.get("user_message"):
-        _finalize_turn(current_turn, len(turns))
-        turns.append(current_turn)
-
-    return turns
+        _finalize_turn(current_turn, turn_count)
+        yield current_turn
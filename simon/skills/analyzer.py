@@ -88,7 +88,7 @@ def score_session_quality(
 def _compute_description_hash(description: str) -> str:
     """Hash a description for duplicate detection."""
     normalized = " ".join(description.lower().split())
-    return hashlib.md5(normalized.encode()).hexdigest()
+    return hashlib.md5(normalized.encode(), usedforsecurity=False).hexdigest()
 
 
 async def _count_todays_auto_skills(session: AsyncSession) -> int:
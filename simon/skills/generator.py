@@ -200,8 +200,8 @@ async def generate_skill_md(
     start_time = time.time()
 
     try:
-        client = anthropic.Anthropic(api_key=settings.anthropic.api_key)
-        response = client.messages.create(
+        client = anthropic.AsyncAnthropic(api_key=settings.anthropic.api_key)
+        response = await client.messages.create(
             model=model,
             max_tokens=2000,
             system=SKILL_GENERATION_SYSTEM,
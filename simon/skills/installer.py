@@ -1,6 +1,8 @@
 """Skill installation — write SKILL.md files to disk and manage them."""
 
+import json
 import logging
+import os
 import re
 import shutil
 from datetime import datetime, timezone
@@ -14,6 +16,11 @@ logger = logging.getLogger(__name__)
 PERSONAL_SKILLS_DIR = Path.home() / ".claude" / "skills"
 PROJECT_SKILLS_DIR = Path(".claude") / "skills"
 
+# Parsed frontmatter of every SKILL.md seen, keyed by path and validated
+# against the file's (mtime_ns, size) so unchanged skills aren't re-read
+SKILLS_INDEX_PATH = Path.home() / ".config" / "simon" / ".skills_index.json"
+_skills_index: Optional[dict[str, list]] = None
+
 
 class InstalledSkill(BaseModel):
     """An installed skill on disk."""
@@ -34,8 +41,24 @@ def _parse_frontmatter(content: str) -> dict:
     Returns:
         Dict of frontmatter fields.
     """
+    return _split_frontmatter(content)[0]
+
+
+def _split_frontmatter(content: str) -> tuple[dict, str]:
+    """Split SKILL.md content into its frontmatter fields and body.
+
+    The frontmatter must open the file and end at a line containing only
+    "---"; a "---" elsewhere (e.g. a horizontal rule) stays in the body.
+
+    Args:
+        content: Full SKILL.md content string.
+
+    Returns:
+        Tuple of (dict of frontmatter fields, body with surrounding
+        whitespace stripped). Without frontmatter, all content is body.
+    """
     if not content.startswith("---"):
-        return {}
+        return {}, content.strip()
 
     lines = content.split("\n")
     end_idx = -1
@@ -45,7 +68,7 @@ def _parse_frontmatter(content: str) -> dict:
             break
 
     if end_idx == -1:
-        return {}
+        return {}, content.strip()
 
     frontmatter = {}
     for line in lines[1:end_idx]:
@@ -53,7 +76,7 @@ def _parse_frontmatter(content: str) -> dict:
             key, _, value = line.partition(":")
             frontmatter[key.strip()] = value.strip()
 
-    return frontmatter
+    return frontmatter, "\n".join(lines[end_idx + 1:]).strip()
 
 
 def validate_skill_content(content: str) -> list[str]:
@@ -159,6 +182,29 @@ def install_skill(
     return skill_path
 
 
+def _load_skills_index() -> dict[str, list]:
+    """Load the skills index from memory, or from disk on first use."""
+    global _skills_index
+    if _skills_index is None:
+        try:
+            _skills_index = json.loads(SKILLS_INDEX_PATH.read_bytes())
+        except (OSError, ValueError):
+            _skills_index = {}
+    return _skills_index
+
+
+def _save_skills_index(index: dict[str, list]) -> None:
+    """Atomically write the skills index to disk."""
+    tmp_path = SKILLS_INDEX_PATH.with_name(f"{SKILLS_INDEX_PATH.name}.{os.getpid()}.tmp")
+    try:
+        SKILLS_INDEX_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps(index))
+        os.replace(tmp_path, SKILLS_INDEX_PATH)
+    except OSError as e:
+        logger.debug("Could not write skills index %s: %s", SKILLS_INDEX_PATH, e)
+        tmp_path.unlink(missing_ok=True)
+
+
 def uninstall_skill(
     name: str,
     scope: str = "personal",
@@ -207,26 +253,51 @@ def list_installed_skills(
         proj_dir = _get_skills_dir("project", project_path)
         dirs_to_scan.append(("project", proj_dir))
 
+    index = _load_skills_index()
+    dirty = False
+
     for skill_scope, skills_dir in dirs_to_scan:
         if not skills_dir.exists():
             continue
 
+        seen = set()
         for entry in sorted(skills_dir.iterdir()):
             skill_md = entry / "SKILL.md"
-            if not entry.is_dir() or not skill_md.exists():
+            try:
+                st = skill_md.stat()
+            except OSError:
                 continue
 
-            content = skill_md.read_text()
-            fm = _parse_frontmatter(content)
+            key = str(skill_md)
+            seen.add(key)
+            cached = index.get(key)
+            if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                name, description, source = cached[2:]
+            else:
+                fm = _parse_frontmatter(skill_md.read_text())
+                name = fm.get("name", entry.name)
+                description = fm.get("description", "")
+                source = fm.get("source")
+                index[key] = [st.st_mtime_ns, st.st_size, name, description, source]
+                dirty = True
 
             skills.append(
                 InstalledSkill(
-                    name=fm.get("name", entry.name),
-                    description=fm.get("description", ""),
+                    name=name,
+                    description=description,
                     path=skill_md,
                     scope=skill_scope,
-                    source=fm.get("source"),
+                    source=source,
                 )
             )
 
+        # Drop entries for skills that have been removed from this directory
+        prefix = f"{skills_dir}{os.sep}"
+        for key in [k for k in index if k.startswith(prefix) and k not in seen]:
+            del index[key]
+            dirty = True
+
+    if dirty:
+        _save_skills_index(index)
+
     return skills
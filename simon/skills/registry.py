@@ -1,8 +1,12 @@
 """Public skill registry — search and install skills from GitHub."""
 
+import hashlib
+import json
 import logging
 import os
 import re
+import time
+from pathlib import Path
 from typing import Optional
 
 import httpx
@@ -19,6 +23,10 @@ DEFAULT_REGISTRIES = [
 
 GITHUB_API = "https://api.github.com"
 
+# Search results are cached on disk to stay clear of GitHub API rate limits
+SEARCH_CACHE_DIR = Path.home() / ".config" / "simon" / ".skill_search_cache"
+SEARCH_CACHE_TTL_SECONDS = 600
+
 
 class RegistrySkill(BaseModel):
     """A skill from a public registry."""
@@ -193,8 +201,15 @@ async def search_skills(
         List of matching skills with metadata.
     """
     repos = sources or DEFAULT_REGISTRIES
+
+    cache_path = _search_cache_path(query, repos)
+    cached = _read_search_cache(cache_path)
+    if cached is not None:
+        return cached
+
     results: list[RegistrySkill] = []
     query_lower = query.lower()
+    had_errors = False
 
     for repo in repos:
         try:
@@ -226,12 +241,47 @@ async def search_skills(
 
         except httpx.HTTPError as e:
             logger.warning("Error searching %s: %s", repo, e)
+            had_errors = True
         except Exception as e:
             logger.warning("Unexpected error searching %s: %s", repo, e)
+            had_errors = True
+
+    # Don't cache partial results from a failed fetch
+    if not had_errors:
+        _write_search_cache(cache_path, results)
 
     return results
 
 
+def _search_cache_path(query: str, repos: list[str]) -> Path:
+    """Get the cache file for a query against a set of registries."""
+    key = hashlib.sha256(f"{query}|{','.join(repos)}".encode()).hexdigest()
+    return SEARCH_CACHE_DIR / f"{key}.json"
+
+
+def _read_search_cache(cache_path: Path) -> Optional[list[RegistrySkill]]:
+    """Return cached search results, or None if missing or expired."""
+    try:
+        if cache_path.stat().st_mtime < time.time() - SEARCH_CACHE_TTL_SECONDS:
+            return None
+        data = json.loads(cache_path.read_bytes())
+        return [RegistrySkill.model_validate(item) for item in data]
+    except (OSError, ValueError):
+        return None
+
+
+def _write_search_cache(cache_path: Path, results: list[RegistrySkill]) -> None:
+    """Atomically write search results to the cache."""
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps([skill.model_dump() for skill in results]))
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.debug("Could not write search cache %s: %s", cache_path, e)
+        tmp_path.unlink(missing_ok=True)
+
+
 async def fetch_skill_from_github(
     repo: str,
     skill_path: str,
@@ -1,12 +1,15 @@
 """Database connection and session management."""
 
+import functools
+import json
 import logging
+from collections.abc import Mapping
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
-from simon.config import get_settings
+from simon.config import DB_SERVER_SETTINGS, get_settings
 from simon.storage.models import Base
 
 logger = logging.getLogger(__name__)
@@ -14,6 +17,19 @@ logger = logging.getLogger(__name__)
 _engine = None
 _session_factory = None
 
+# Per-connection prepared statement cache size (both default to 100)
+_STATEMENT_CACHE_SIZE = 256
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize read-only mappings (e.g. shared artifact metadata) as objects."""
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+_json_serializer = functools.partial(json.dumps, default=_json_default)
+
 
 def get_engine():
     """Get or create the async engine singleton."""
@@ -23,8 +39,20 @@ def get_engine():
         _engine = create_async_engine(
             settings.general.db_url,
             echo=False,
-            pool_size=10,
-            max_overflow=20,
+            # A retrieval runs ~10 queries at once, one connection each
+            pool_size=20,
+            max_overflow=10,
+            # The worker holds connections for hours; drop dead or stale ones
+            pool_pre_ping=True,
+            pool_recycle=300,
+            connect_args={
+                "server_settings": DB_SERVER_SETTINGS,
+                # Prepared statements cached per connection: SQLAlchemy's
+                # adapter and asyncpg's own cache
+                "prepared_statement_cache_size": _STATEMENT_CACHE_SIZE,
+                "statement_cache_size": _STATEMENT_CACHE_SIZE,
+            },
+            json_serializer=_json_serializer,
         )
     return _engine
 
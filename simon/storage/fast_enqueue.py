@@ -0,0 +1,114 @@
+"""Hook fast path for enqueueing jobs without SQLAlchemy.
+
+The Stop hook only needs to insert one row into focus_jobs. Going through
+the ORM means importing SQLAlchemy and building an engine and session for
+a single statement, so this module talks to PostgreSQL via asyncpg directly.
+"""
+
+import json
+import logging
+import uuid
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+_INSERT_JOB_SQL = """
+    INSERT INTO focus_jobs (id, kind, payload, dedupe_key, priority, max_attempts, status)
+    VALUES ($1, $2, $3::jsonb, $4, $5, $6, 'queued')
+    ON CONFLICT (dedupe_key) DO NOTHING
+"""
+
+
+def _asyncpg_dsn(db_url: str) -> str:
+    """Convert a SQLAlchemy URL (postgresql+asyncpg://...) to an asyncpg DSN."""
+    return db_url.replace("postgresql+asyncpg://", "postgresql://", 1)
+
+
+async def enqueue_job_raw(
+    kind: str,
+    payload: dict,
+    dedupe_key: Optional[str] = None,
+    priority: int = 10,
+    max_attempts: int = 10,
+) -> bool:
+    """Insert a job row with a single asyncpg round-trip.
+
+    Same semantics as storage.jobs.enqueue_job, minus returning the ORM row.
+
+    Args:
+        kind: Job type (e.g., 'session_process').
+        payload: JSON-serializable job data.
+        dedupe_key: If set, prevents duplicate jobs with same key.
+        priority: Lower number = higher priority.
+        max_attempts: Max retries before permanent failure.
+
+    Returns:
+        True if a job was inserted, False if deduplicated.
+    """
+    import asyncpg
+
+    from simon.config import DB_SERVER_SETTINGS, get_settings
+
+    conn = await asyncpg.connect(
+        _asyncpg_dsn(get_settings().general.db_url),
+        server_settings=DB_SERVER_SETTINGS,
+    )
+    try:
+        status = await conn.execute(
+            _INSERT_JOB_SQL,
+            uuid.uuid4(),
+            kind,
+            json.dumps(payload),
+            dedupe_key,
+            priority,
+            max_attempts,
+        )
+    finally:
+        await conn.close()
+
+    # asyncpg returns the command tag, e.g. "INSERT 0 1"
+    inserted = status.endswith(" 1")
+    if not inserted:
+        logger.debug("Job deduplicated: %s", dedupe_key)
+    return inserted
+
+
+async def enqueue_session_recording_fast(
+    session_id: str,
+    transcript_path: str,
+    workspace_path: str,
+) -> bool:
+    """Enqueue a session_process job for the Stop hook.
+
+    Mirrors context.recorder.enqueue_session_recording, including the
+    file-size dedupe key, without importing the ORM.
+
+    Args:
+        session_id: Claude Code session ID.
+        transcript_path: Path to the .jsonl transcript file.
+        workspace_path: Working directory of the session.
+
+    Returns:
+        True if job was enqueued, False if duplicate or on error.
+    """
+    file_size = 0
+    try:
+        file_size = Path(transcript_path).stat().st_size
+    except OSError:
+        pass
+
+    try:
+        return await enqueue_job_raw(
+            kind="session_process",
+            payload={
+                "session_id": session_id,
+                "transcript_path": transcript_path,
+                "workspace_path": workspace_path,
+            },
+            dedupe_key=f"session_process:{session_id}:{file_size}",
+            priority=5,
+        )
+    except Exception as e:
+        logger.error("Failed to enqueue recording: %s", e)
+        return False
@@ -2,10 +2,12 @@
 
 import logging
 import uuid
+from collections import OrderedDict
+from collections.abc import Iterable
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
-from sqlalchemy import text, update
+from sqlalchemy import event, select, text, update
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -13,6 +15,79 @@ from simon.storage.models import FocusJob
 
 logger = logging.getLogger(__name__)
 
+# Rows per multi-VALUES INSERT; 8 binds per row keeps each statement far
+# below PostgreSQL's 32767 bind parameter limit
+_BULK_ENQUEUE_CHUNK = 1000
+
+# Dedupe keys known to exist in committed focus_jobs rows, oldest first.
+# Job rows are never deleted, so a committed key will conflict forever and
+# the INSERT can be skipped without a round-trip. Keys only enter the cache
+# once the transaction that inserted (or conflicted on) them commits.
+_KNOWN_DEDUPE_KEYS_MAX = 50_000
+_known_dedupe_keys: OrderedDict[str, None] = OrderedDict()
+
+
+def _remember_dedupe_keys(keys: Iterable[str]) -> None:
+    """Add keys to the known-key cache, evicting the oldest past the cap."""
+    for key in keys:
+        _known_dedupe_keys[key] = None
+    while len(_known_dedupe_keys) > _KNOWN_DEDUPE_KEYS_MAX:
+        _known_dedupe_keys.popitem(last=False)
+
+
+def _remember_dedupe_keys_on_commit(session: AsyncSession, keys: list[str]) -> None:
+    """Cache keys inserted or conflicted on by session once (and only if) it commits.
+
+    A rolled-back insert must not be remembered, or a retry of the same
+    work would wrongly skip re-enqueueing it. A conflict doesn't prove the
+    key is committed either: the row may have been inserted earlier in this
+    same transaction. Keys are tracked against the
+    innermost transaction, so rolling back a SAVEPOINT discards the keys
+    inserted inside it even if the outer transaction later commits.
+    """
+    if not keys:
+        return
+
+    sync_session = session.sync_session
+    pending = sync_session.info.get("pending_dedupe_keys")
+    if pending is None:
+        pending = sync_session.info["pending_dedupe_keys"] = []
+        event.listen(sync_session, "after_commit", _commit_pending_dedupe_keys)
+        event.listen(sync_session, "after_soft_rollback", _discard_pending_dedupe_keys)
+
+    transaction = sync_session.get_nested_transaction() or sync_session.get_transaction()
+    pending.append((transaction, keys))
+
+
+def _commit_pending_dedupe_keys(sync_session) -> None:
+    """after_commit hook: the outer transaction committed every pending key.
+
+    after_commit also fires when a SAVEPOINT is released, while it is still
+    the session's nested transaction. Its keys stay pending until the outer
+    transaction commits, since that commit can still fail.
+    """
+    if sync_session.in_nested_transaction():
+        return
+
+    pending = sync_session.info["pending_dedupe_keys"]
+    for _, keys in pending:
+        _remember_dedupe_keys(keys)
+    pending.clear()
+
+
+def _discard_pending_dedupe_keys(sync_session, rolled_back) -> None:
+    """after_soft_rollback hook: drop keys inserted within the rolled-back transaction."""
+
+    def _inside(transaction) -> bool:
+        while transaction is not None:
+            if transaction is rolled_back:
+                return True
+            transaction = transaction.parent
+        return False
+
+    pending = sync_session.info["pending_dedupe_keys"]
+    pending[:] = [(tx, keys) for tx, keys in pending if not _inside(tx)]
+
 
 async def enqueue_job(
     session: AsyncSession,
@@ -38,6 +113,10 @@ async def enqueue_job(
     job_id = uuid.uuid4()
 
     if dedupe_key:
+        if dedupe_key in _known_dedupe_keys:
+            logger.debug("Job deduplicated (cached): %s", dedupe_key)
+            return None
+
         stmt = pg_insert(FocusJob).values(
             id=job_id,
             kind=kind,
@@ -51,8 +130,10 @@ async def enqueue_job(
         result = await session.execute(stmt)
         if result.rowcount == 0:
             logger.debug("Job deduplicated: %s", dedupe_key)
+            _remember_dedupe_keys_on_commit(session, [dedupe_key])
             return None
 
+        _remember_dedupe_keys_on_commit(session, [dedupe_key])
         await session.flush()
         return await session.get(FocusJob, job_id)
     else:
@@ -68,6 +149,59 @@ async def enqueue_job(
         return job
 
 
+async def enqueue_jobs_bulk(
+    session: AsyncSession,
+    rows: list[dict],
+) -> int:
+    """Enqueue many jobs in one INSERT, skipping duplicate dedupe_keys.
+
+    Rows whose dedupe_key is already known to exist are dropped before
+    the INSERT; if that leaves nothing, no statement is sent at all.
+
+    Args:
+        session: Database session.
+        rows: Job dicts with 'kind', 'payload' and optionally 'dedupe_key',
+            'priority' and 'max_attempts' (same meaning as enqueue_job).
+
+    Returns:
+        Number of jobs actually inserted.
+    """
+    values = [
+        {
+            "id": uuid.uuid4(),
+            "kind": row["kind"],
+            "payload": row["payload"],
+            "dedupe_key": row.get("dedupe_key"),
+            "priority": row.get("priority", 10),
+            "max_attempts": row.get("max_attempts", 10),
+            "status": "queued",
+        }
+        for row in rows
+        if row.get("dedupe_key") not in _known_dedupe_keys
+    ]
+    if len(values) < len(rows):
+        logger.debug("Deduplicated %d of %d jobs (cached)", len(rows) - len(values), len(rows))
+    if not values:
+        return 0
+
+    inserted = 0
+    for start in range(0, len(values), _BULK_ENQUEUE_CHUNK):
+        result = await session.execute(
+            pg_insert(FocusJob)
+            .values(values[start:start + _BULK_ENQUEUE_CHUNK])
+            .on_conflict_do_nothing(index_elements=["dedupe_key"])
+        )
+        inserted += result.rowcount
+
+    if inserted < len(values):
+        logger.debug("Deduplicated %d of %d jobs", len(values) - inserted, len(values))
+    # Inserted and conflicting keys alike exist once this transaction commits
+    _remember_dedupe_keys_on_commit(
+        session, [value["dedupe_key"] for value in values if value["dedupe_key"] is not None]
+    )
+    return inserted
+
+
 async def claim_job(
     session: AsyncSession,
     kinds: Optional[list[str]] = None,
@@ -120,6 +254,56 @@ async def claim_job(
     return job
 
 
+async def claim_jobs_batch(
+    session: AsyncSession,
+    kinds: Optional[list[str]] = None,
+    limit: int = 20,
+    lease_seconds: int = 300,
+) -> list[FocusJob]:
+    """Claim up to limit available jobs in a single statement.
+
+    Same locking as claim_job, but leases a whole batch per round-trip
+    and loads the rows straight from RETURNING.
+
+    Args:
+        session: Database session.
+        kinds: Filter to specific job kinds. None means all kinds.
+        limit: Maximum number of jobs to claim.
+        lease_seconds: How long the lease lasts before expiry.
+
+    Returns:
+        The claimed jobs in priority order (empty if none available).
+    """
+    kind_filter = ""
+    params: dict = {"lease_seconds": lease_seconds, "limit": limit}
+
+    if kinds:
+        kind_filter = "AND kind = ANY(:kinds)"
+        params["kinds"] = kinds
+
+    query = text(f"""
+        UPDATE focus_jobs
+        SET status = 'processing',
+            locked_until = now() + make_interval(secs => :lease_seconds),
+            attempts = attempts + 1,
+            updated_at = now()
+        WHERE id IN (
+            SELECT id FROM focus_jobs
+            WHERE status IN ('queued', 'retry')
+              AND (locked_until IS NULL OR locked_until < now())
+              {kind_filter}
+            ORDER BY priority ASC, created_at ASC
+            LIMIT :limit
+            FOR UPDATE SKIP LOCKED
+        )
+        RETURNING *
+    """)
+
+    result = await session.execute(select(FocusJob).from_statement(query), params)
+    # RETURNING doesn't preserve the subquery's ORDER BY
+    return sorted(result.scalars(), key=lambda job: (job.priority, job.created_at))
+
+
 async def complete_job(
     session: AsyncSession,
     job_id: uuid.UUID,
@@ -137,6 +321,57 @@ async def complete_job(
     )
 
 
+async def complete_jobs(
+    session: AsyncSession,
+    job_ids: list[uuid.UUID],
+) -> None:
+    """Mark several jobs as done in one statement.
+
+    Args:
+        session: Database session.
+        job_ids: The jobs to complete.
+    """
+    if not job_ids:
+        return
+    await session.execute(
+        update(FocusJob)
+        .where(FocusJob.id.in_(job_ids))
+        .values(status="done", updated_at=datetime.now(timezone.utc))
+    )
+
+
+def _failure_values(job: FocusJob, error_message: str, now: datetime) -> dict:
+    """Build the column updates for a failed job and log the outcome.
+
+    Args:
+        job: The job that failed.
+        error_message: Description of the failure.
+        now: Timestamp to record.
+
+    Returns:
+        Dict of column values for the UPDATE.
+    """
+    if job.attempts < job.max_attempts:
+        backoff_seconds = min((2 ** job.attempts) * 30, 3600)
+        logger.info(
+            "Job %s retry #%d in %ds: %s",
+            job.id, job.attempts, backoff_seconds, error_message,
+        )
+        return {
+            "status": "retry",
+            "error_message": error_message,
+            "locked_until": now + timedelta(seconds=backoff_seconds),
+            "updated_at": now,
+        }
+
+    logger.warning("Job %s permanently failed after %d attempts: %s", job.id, job.attempts, error_message)
+    return {
+        "status": "failed",
+        "error_message": error_message,
+        "updated_at": now,
+    }
+
+
 async def fail_job(
     session: AsyncSession,
     job_id: uuid.UUID,
@@ -157,35 +392,44 @@ async def fail_job(
         logger.warning("Cannot fail job %s: not found", job_id)
         return
 
+    await session.execute(
+        update(FocusJob)
+        .where(FocusJob.id == job_id)
+        .values(**_failure_values(job, error_message, datetime.now(timezone.utc)))
+    )
+
+
+async def fail_jobs(
+    session: AsyncSession,
+    failures: list[tuple[uuid.UUID, str]],
+) -> None:
+    """Fail several jobs, loading them in one query and updating in one batch.
+
+    Each job gets the same retry/backoff treatment as fail_job.
+
+    Args:
+        session: Database session.
+        failures: (job_id, error_message) pairs.
+    """
+    if not failures:
+        return
+
+    errors = dict(failures)
+    jobs = (await session.execute(
+        select(FocusJob).where(FocusJob.id.in_(errors))
+    )).scalars().all()
+
     now = datetime.now(timezone.utc)
+    rows = [
+        {"id": job.id, **_failure_values(job, errors.pop(job.id), now)}
+        for job in jobs
+    ]
+    for job_id in errors:
+        logger.warning("Cannot fail job %s: not found", job_id)
 
-    if job.attempts < job.max_attempts:
-        backoff_seconds = min((2 ** job.attempts) * 30, 3600)
-        await session.execute(
-            update(FocusJob)
-            .where(FocusJob.id == job_id)
-            .values(
-                status="retry",
-                error_message=error_message,
-                locked_until=now + timedelta(seconds=backoff_seconds),
-                updated_at=now,
-            )
-        )
-        logger.info(
-            "Job %s retry #%d in %ds: %s",
-            job_id, job.attempts, backoff_seconds, error_message,
-        )
-    else:
-        await session.execute(
-            update(FocusJob)
-            .where(FocusJob.id == job_id)
-            .values(
-                status="failed",
-                error_message=error_message,
-                updated_at=now,
-            )
-        )
-        logger.warning("Job %s permanently failed after %d attempts: %s", job_id, job.attempts, error_message)
+    if rows:
+        # ORM bulk UPDATE by primary key: one executemany round-trip
+        await session.execute(update(FocusJob), rows)
 
 
 async def expire_stale_leases(
@@ -8,6 +8,7 @@ from sqlalchemy import (
     ARRAY,
     Boolean,
     CheckConstraint,
+    Computed,
     Date,
     DateTime,
     Float,
@@ -18,6 +19,7 @@ from sqlalchemy import (
     Text,
     UniqueConstraint,
     func,
+    text,
 )
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
@@ -220,6 +222,10 @@ class AgentSession(Base):
     session_id: Mapped[str] = mapped_column(Text, unique=True, nullable=False)
     transcript_path: Mapped[Optional[str]] = mapped_column(Text)
     workspace_path: Mapped[Optional[str]] = mapped_column(Text)
+    # Lowercased workspace directory name, matched against the prompt's cwd
+    workspace_name: Mapped[Optional[str]] = mapped_column(
+        Text, Computed("lower(regexp_replace(rtrim(workspace_path, '/'), '^.*/', ''))", persisted=True)
+    )
     provider: Mapped[str] = mapped_column(Text, default="claude")
     session_title: Mapped[Optional[str]] = mapped_column(Text)
     session_summary: Mapped[Optional[str]] = mapped_column(Text)
@@ -238,6 +244,15 @@ class AgentSession(Base):
 
     __table_args__ = (
         Index("idx_agent_sessions_workspace", "workspace_path"),
+        Index("idx_agent_sessions_workspace_name", "workspace_name"),
+        # Sessions imported by older `record --all` runs stored Claude's
+        # mangled project dir (e.g. -home-user-proj) as workspace_path;
+        # suffix matches on those become prefix matches on the reverse
+        Index(
+            "idx_agent_sessions_workspace_mangled",
+            text("reverse(lower(workspace_path)) text_pattern_ops"),
+            postgresql_where="workspace_path NOT LIKE '%/%'",
+        ),
         Index("idx_agent_sessions_project", "project_id"),
         Index("idx_agent_sessions_processed", "is_processed", postgresql_where="is_processed = FALSE"),
         Index("idx_agent_sessions_activity", "last_activity_at"),
@@ -277,6 +292,7 @@ class AgentTurn(Base):
         UniqueConstraint("session_id", "turn_number"),
         Index("idx_agent_turns_session", "session_id"),
         Index("idx_agent_turns_hash", "content_hash"),
+        Index("idx_agent_turns_session_hash", "session_id", "content_hash", unique=True),
         Index("idx_agent_turns_started", "started_at"),
     )
 
@@ -299,6 +315,10 @@ class AgentTurnContent(Base):
 
     turn: Mapped["AgentTurn"] = relationship(back_populates="content")
 
+    __table_args__ = (
+        Index("idx_agent_turn_content_files", "files_touched", postgresql_using="gin"),
+    )
+
 
 class AgentTurnEntity(Base):
     __tablename__ = "agent_turn_entities"
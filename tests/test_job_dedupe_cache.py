@@ -0,0 +1,91 @@
+"""The known-dedupe-key cache only holds keys from committed transactions."""
+
+from collections import OrderedDict
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from simon.storage import jobs
+
+
+class _ConflictingSession:
+    """Stands in for an AsyncSession whose INSERTs all hit ON CONFLICT."""
+
+    def __init__(self) -> None:
+        self.sync_session = Session(create_engine("sqlite://"))
+
+    async def execute(self, stmt, params=None):
+        return SimpleNamespace(rowcount=0)
+
+
+@pytest.fixture(autouse=True)
+def known_keys(monkeypatch):
+    cache: OrderedDict[str, None] = OrderedDict()
+    monkeypatch.setattr(jobs, "_known_dedupe_keys", cache)
+    return cache
+
+
+async def test_conflicting_key_is_cached_after_commit(known_keys):
+    session = _ConflictingSession()
+    session.sync_session.begin()
+
+    assert await jobs.enqueue_job(session, "session_summary", {}, dedupe_key="session_summary:a") is None
+    assert "session_summary:a" not in known_keys
+
+    session.sync_session.commit()
+    assert "session_summary:a" in known_keys
+
+
+async def test_conflicting_key_is_not_cached_after_rollback(known_keys):
+    # The conflicting row may be this transaction's own uncommitted insert
+    session = _ConflictingSession()
+    session.sync_session.begin()
+
+    await jobs.enqueue_jobs_bulk(session, [
+        {"kind": "skill_extract", "payload": {}, "dedupe_key": "skill_extract:a"},
+        {"kind": "skill_extract", "payload": {}},
+    ])
+    session.sync_session.rollback()
+
+    assert not known_keys
+
+
+def _savepoint_session() -> Session:
+    session = Session(create_engine("sqlite://"))
+    session.begin()
+    return session
+
+
+def test_released_savepoint_keys_wait_for_outer_commit(known_keys):
+    session = _savepoint_session()
+    with session.begin_nested():
+        jobs._remember_dedupe_keys_on_commit(SimpleNamespace(sync_session=session), ["session_summary:a"])
+    assert "session_summary:a" not in known_keys
+
+    session.commit()
+    assert "session_summary:a" in known_keys
+
+
+def test_released_savepoint_keys_dropped_when_outer_rolls_back(known_keys):
+    session = _savepoint_session()
+    with session.begin_nested():
+        jobs._remember_dedupe_keys_on_commit(SimpleNamespace(sync_session=session), ["session_summary:a"])
+    with session.begin_nested():
+        jobs._remember_dedupe_keys_on_commit(SimpleNamespace(sync_session=session), ["skill_extract:a"])
+
+    session.rollback()
+    assert not known_keys
+
+
+def test_rolled_back_savepoint_keys_dropped_when_outer_commits(known_keys):
+    session = _savepoint_session()
+    nested = session.begin_nested()
+    jobs._remember_dedupe_keys_on_commit(SimpleNamespace(sync_session=session), ["session_summary:a"])
+    nested.rollback()
+    with session.begin_nested():
+        jobs._remember_dedupe_keys_on_commit(SimpleNamespace(sync_session=session), ["skill_extract:a"])
+
+    session.commit()
+    assert list(known_keys) == ["skill_extract:a"]
@@ -0,0 +1,61 @@
+"""Workspace matching for sessions imported by `simon record --all`."""
+
+import json
+import re
+
+from sqlalchemy.dialects import postgresql
+
+from simon.context.retriever import _workspace_filter
+from simon.ingestion.claude_code import read_session_cwd
+
+
+def _mangle(cwd: str) -> str:
+    """Claude Code's session directory name for a cwd."""
+    return re.sub(r"[^a-zA-Z0-9]", "-", cwd)
+
+
+def _write_transcript(path, cwd):
+    lines = [
+        {"type": "summary", "summary": "Earlier work"},
+        {"type": "user", "cwd": cwd, "message": {"role": "user", "content": "hi"}},
+        {"type": "assistant", "cwd": cwd, "message": {"role": "assistant", "content": "hello"}},
+    ]
+    path.write_text("\n".join(json.dumps(line) for line in lines) + "\n")
+
+
+def test_read_session_cwd_returns_first_cwd(tmp_path):
+    transcript = tmp_path / "session.jsonl"
+    _write_transcript(transcript, "/home/user/my_proj")
+
+    assert read_session_cwd(transcript) == "/home/user/my_proj"
+
+
+def test_read_session_cwd_without_cwd(tmp_path):
+    transcript = tmp_path / "session.jsonl"
+    transcript.write_text('{"type": "summary"}\nnot json\n')
+
+    assert read_session_cwd(transcript) is None
+    assert read_session_cwd(tmp_path / "missing.jsonl") is None
+
+
+def _compiled(workspace_name):
+    return _workspace_filter(workspace_name).compile(dialect=postgresql.dialect())
+
+
+def test_workspace_filter_matches_generated_name():
+    compiled = _compiled("my_proj")
+
+    assert "agent_sessions.workspace_name = " in str(compiled)
+    assert compiled.params["workspace_name_1"] == "my_proj"
+
+
+def test_workspace_filter_matches_legacy_mangled_path():
+    # Rows recorded by older `record --all` runs hold the mangled dir name
+    stored = _mangle("/home/user/my_proj").lower()
+    compiled = _compiled("my_proj")
+
+    (pattern,) = [v for k, v in compiled.params.items() if k.startswith("reverse")]
+    assert pattern.endswith("%")
+    assert stored[::-1].startswith(pattern[:-1])
+    # Another project that merely ends in the same characters doesn't match
+    assert not _mangle("/home/user/notmy_proj").lower()[::-1].startswith(pattern[:-1])